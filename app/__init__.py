@@ -1,4 +1,5 @@
 import os, logging
+from ast import literal_eval
 from flask import Flask
 from flask_dotenv import DotEnv
 from flask_sqlalchemy import SQLAlchemy
@@ -60,9 +61,11 @@ from .routes import auth, starling, user
 
 
 # Initialise Database
-from .models import user, transaction, estimate
+from .models import user, transaction, estimate, job, aggregate
+from .migrate import migrate
 with app.app_context():
     db.create_all()
+    migrate()
 
     # Create admin user if none exists
     if user.User.query.count() == 0:
@@ -78,21 +81,48 @@ with app.app_context():
         db.session.add(user)
         db.session.commit()
     
-    # Create category emission factors if none exist
-    if estimate.GroceryItem.query.count() == 0:
-        print('Generating category emission factors...')
-        from .datasets.item_emission_factors import emission_factors
-        from .models.embedding import model
-        for item, factor in emission_factors.items():
-            embedded = model.get_embeddings(item)[0]
-
-            item = estimate.GroceryItem(
-                name=item,
-                factor=factor,
-                vector=embedded
-            )
-            db.session.add(item)
-            print(f'{item.name} added to database.')
+    # Create category emission factors if none exist, or they were embedded by a different model, from the prebuilt artifact
+    # if it matches the model.
+    from .models.embedding import model, categories
+    if estimate.GroceryItem.query.count() == 0 or estimate.GroceryItem.embedded_by_other_models(model.key):
+        if estimate.GroceryItem.query.delete(): print(f'Category emission factors were embedded by a different model to {model.key}.')
+        artifact_path = os.getenv('CATEGORY_VECTORS', str(categories.default_path))
+
+        try:
+            names, factors, vectors = categories.load(artifact_path, model.key)
+            print(f'Loading category emission factors from {artifact_path}...')
+        except (OSError, ValueError) as e:
+            print(f'Unable to use category vectors artifact: {e}')
+            print('Generating category emission factors...')
+            from .datasets.item_emission_factors import emission_factors
+            names = list(emission_factors.keys())
+            factors = list(emission_factors.values())
+            vectors = model.get_embeddings_batch(names)
+
+        db.session.add_all(
+            estimate.GroceryItem(name=name, factor=factor, vector=vector, model=model.key)
+            for name, factor, vector in zip(names, factors, vectors)
+        )
         db.session.commit()
-        print('Finished generating category emission factors.')
+        print(f'Finished generating {len(names)} category emission factors.')
+
+    # Rebuild merchant and daily totals if they have not been kept yet, or the merchant half life has changed.
+    for totals in (aggregate.MerchantTotal, aggregate.DailyTotal):
+        if totals.needs_rebuild():
+            totals.rebuild()
+            db.session.commit()
+
+    # Drop item matches made by a different embedding model.
+    if estimate.ResolvedItem.drop_other_models(estimate.ResolvedItem.key()): db.session.commit()
+
+# Load the embedding model at startup rather than on the first item estimate.
+if literal_eval(os.getenv('EMBEDDING_WARMUP', 'False')):
+    model.warm_up()
+
+# Background estimation workers, started by the first request a process serves so that scripts importing the app, and the
+# reloader's parent process, don't run them. Set to 0 to only run them in a separate worker.py process.
+estimate_workers = int(os.getenv('ESTIMATE_WORKERS', 2))
 
+@app.before_request
+def start_estimate_workers():
+    job.EstimateJob.start_workers(estimate_workers)
@@ -0,0 +1,180 @@
+from . import db
+from sqlalchemy import inspect, text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.schema import CreateTable
+from ast import literal_eval
+import re, pickle, warnings
+
+
+# Brings an existing database up to date with the models. db.create_all only creates missing tables, so anything added
+# to an existing table is created here. Each step checks first, so migrate can run on every startup. Changes that can't be
+# made safely at startup are left to python migrate.py, which runs migrate with strict set.
+
+
+def create_columns(strict: bool = False) -> list:
+    """Adds any nullable column declared on a model that is missing from its table. Returns the names of the columns added.
+
+    A missing column that isn't nullable can't be added to existing rows. It raises a RuntimeError if strict, or is skipped
+    with a warning."""
+
+    created = []
+    for table in db.metadata.sorted_tables:
+        existing = {column['name'] for column in inspect(db.engine).get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing: continue
+            if not column.nullable:
+                message = f'{table.name}.{column.name} must be nullable to be added to an existing table'
+                if strict: raise RuntimeError(message)
+                warnings.warn(message)
+                continue
+
+            with db.engine.begin() as connection:
+                connection.execute(text(f'ALTER TABLE "{table.name}" ADD COLUMN "{column.name}" {column.type.compile(db.engine.dialect)}'))
+            created.append(f'{table.name}.{column.name}')
+
+    return created
+
+
+def relax_not_null(strict: bool = False) -> list:
+    """Rebuilds any table with a NOT NULL column that its model now declares nullable. Returns the names of the tables rebuilt.
+
+    SQLite can't change a column's constraints in place, so the rows are copied into a new table created from the model,
+    which then replaces the old one. Indexes are recreated by create_indexes. Each table is rebuilt in an exclusive
+    transaction, so processes starting together take turns, and only committed if it breaks no foreign keys. A table that
+    can't be rebuilt raises a RuntimeError if strict, or is skipped with a warning."""
+
+    rebuilt = []
+    for table in db.metadata.sorted_tables:
+        existing = [column for column in inspect(db.engine).get_columns(table.name) if column['name'] in table.c]
+        if not any(table.c[column['name']].nullable and not column['nullable'] for column in existing): continue
+
+        new_name = f'_new_{table.name}'
+        create = re.sub(rf'CREATE TABLE ("?){table.name}\1', f'CREATE TABLE "{new_name}"', str(CreateTable(table).compile(db.engine)), count=1)
+
+        # Transactions are begun by hand, since foreign key enforcement can only be changed outside of one.
+        with db.engine.connect().execution_options(isolation_level='AUTOCOMMIT') as connection:
+            foreign_keys = connection.exec_driver_sql('PRAGMA foreign_keys').scalar()
+            connection.exec_driver_sql('PRAGMA foreign_keys = OFF')
+            try:
+                try:
+                    connection.exec_driver_sql('BEGIN EXCLUSIVE')
+                except OperationalError as e:
+                    message = f'{table.name} could not be locked to be rebuilt: {e}'
+                    if strict: raise RuntimeError(message)
+                    warnings.warn(message)
+                    continue
+
+                # Another process may have rebuilt the table while this one waited for the lock.
+                existing = [row for row in connection.exec_driver_sql(f'PRAGMA table_info("{table.name}")') if row[1] in table.c]
+                if not any(table.c[name].nullable and not_null for _, name, _, not_null, *_ in existing): continue
+
+                broken = len(connection.exec_driver_sql('PRAGMA foreign_key_check').fetchall())
+                names = ', '.join(f'"{name}"' for _, name, *_ in existing)
+                connection.exec_driver_sql(create)
+                connection.exec_driver_sql(f'INSERT INTO "{new_name}" ({names}) SELECT {names} FROM "{table.name}"')
+                connection.exec_driver_sql(f'DROP TABLE "{table.name}"')
+                connection.exec_driver_sql(f'ALTER TABLE "{new_name}" RENAME TO "{table.name}"')
+
+                if len(connection.exec_driver_sql('PRAGMA foreign_key_check').fetchall()) > broken:
+                    message = f'{table.name} was not rebuilt, as rebuilding it would break foreign keys'
+                    if strict: raise RuntimeError(message)
+                    warnings.warn(message)
+                    continue
+
+                connection.exec_driver_sql('COMMIT')
+                rebuilt.append(table.name)
+            finally:
+                if connection.connection.dbapi_connection.in_transaction: connection.exec_driver_sql('ROLLBACK')
+                connection.exec_driver_sql(f'PRAGMA foreign_keys = {foreign_keys}')
+
+    return rebuilt
+
+
+def create_indexes() -> list:
+    """Creates any index declared on a model that is missing from its table. Returns the names of the indexes created."""
+
+    created = []
+    for table in db.metadata.sorted_tables:
+        existing = {index['name'] for index in inspect(db.engine).get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(db.engine)
+                created.append(index.name)
+
+    return created
+
+
+def convert_receipt_items() -> int:
+    """Converts the pickled items of receipts saved before receipt_item into ReceiptItems. Returns the number of receipts converted."""
+
+    from .models.transaction import Receipt, ReceiptItem
+
+    converted = 0
+    for receipt in Receipt.query.filter(Receipt.pickled_items != None).all():
+
+        # Clear the pickled items first, so that a process converting them at the same time skips the receipt.
+        cleared = Receipt.query.filter(Receipt.id == receipt.id, Receipt.pickled_items != None) \
+            .update({'pickled_items': None}, synchronize_session=False)
+        if not cleared: continue
+
+        for position, (name, weightprice) in enumerate(receipt.pickled_items.items()):
+            weight, price = literal_eval(weightprice)
+            receipt.items.append(ReceiptItem(position=position, name=name, weight_kg=weight, price_pence=price))
+        converted += 1
+
+    db.session.commit()
+    return converted
+
+
+def convert_category_vectors() -> int:
+    """Re-encodes category vectors that were pickled, or stored at a different precision, as Vector blobs of the configured dtype.
+    Returns the number of vectors converted."""
+
+    from .models.estimate import GroceryItem
+    from .models.vector import Vector
+
+    dtype = GroceryItem.__table__.c.vector.type.dtype
+    converted = []
+    for name, blob in db.session.execute(text('SELECT name, vector FROM category')):
+        blob_dtype = Vector.dtype_of(blob)
+        if blob_dtype == dtype: continue
+
+        vector = Vector.decode(blob) if blob_dtype else pickle.loads(blob)
+        converted.append({'name': name, 'vector': Vector.encode(vector, dtype)})
+
+    if len(converted) > 0:
+        db.session.execute(text('UPDATE category SET vector = :vector WHERE name = :name'), converted)
+        db.session.commit()
+
+    return len(converted)
+
+
+def record_category_models() -> int:
+    """Records the model of categories stored before category.model, which were embedded by the configured MODEL with the
+    torch backend, the only one there was. Returns the number of categories recorded."""
+
+    from .models.estimate import GroceryItem
+    if GroceryItem.query.filter(GroceryItem.model == None).first() is None: return 0
+
+    from .models.embedding import model
+    key = model.key if model.backend == 'torch' else f'{model!r}-{model.version}'
+    recorded = GroceryItem.query.filter(GroceryItem.model == None).update({'model': key}, synchronize_session=False)
+    db.session.commit()
+    return recorded
+
+
+def migrate(strict: bool = False) -> None:
+    """Runs every migration step. If strict, raises a RuntimeError for any change it can't make."""
+
+    for name in create_columns(strict): print(f'Added column {name}.')
+    for name in relax_not_null(strict): print(f'Rebuilt table {name}.')
+    for name in create_indexes(): print(f'Created index {name}.')
+
+    converted = convert_receipt_items()
+    if converted: print(f'Converted the items of {converted} receipts.')
+
+    converted = convert_category_vectors()
+    if converted: print(f'Converted {converted} category vectors.')
+
+    recorded = record_category_models()
+    if recorded: print(f'Recorded the embedding model of {recorded} categories.')
@@ -0,0 +1,268 @@
+from .. import db
+from sqlalchemy import Column, String, Integer, Float, Date, DateTime, event, inspect, func, case
+from sqlalchemy.orm import Session
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from .transaction import Transaction
+from collections import defaultdict
+from datetime import datetime, date, timedelta
+from itertools import chain
+import os
+
+
+# 'merchant' bases the merchant method on every user's transactions with a merchant, 'user' on the user's own.
+merchant_factor_scope = os.getenv('MERCHANT_FACTOR_SCOPE', 'merchant')
+if merchant_factor_scope not in ('merchant', 'user'): raise ValueError('MERCHANT_FACTOR_SCOPE must be merchant or user')
+
+# If set, older transactions count for half as much per this many days when calculating a merchant's emission factor.
+merchant_factor_half_life = float(os.getenv('MERCHANT_FACTOR_HALF_LIFE_DAYS', 0))
+if merchant_factor_half_life < 0: raise ValueError('MERCHANT_FACTOR_HALF_LIFE_DAYS must not be negative')
+
+
+class MerchantTotal(db.Model):
+    """Running totals of the estimated transactions with a merchant, overall (user_id '') and per user."""
+    __tablename__ = 'merchant_total'
+
+    user_id = Column(String(36), primary_key=True, default='')
+    merchant_id = Column(String(36), primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    co2e = Column(Float, nullable=False, default=0)
+    amount_pence = Column(Integer, nullable=False, default=0)
+
+    # Totals with each transaction weighted by 2 ** -(days before last_updated / half life), so no weight is above 1.
+    weighted_co2e = Column(Float, nullable=False, default=0)
+    weighted_amount_pence = Column(Float, nullable=False, default=0)
+    half_life_days = Column(Float, nullable=False, default=0)
+    last_updated = Column(DateTime, nullable=True)
+
+
+    @staticmethod
+    def keys(transaction: Transaction) -> list:
+        """Returns the (user id, merchant id) of every total a transaction counts towards."""
+
+        keys = [('', transaction.merchant_id)]
+        if transaction.user_id: keys.append((transaction.user_id, transaction.merchant_id))
+        return keys
+
+    @staticmethod
+    def key(transaction: Transaction) -> tuple:
+        """Returns the (user id, merchant id) of the totals used to estimate a transaction under the configured scope."""
+
+        return (transaction.user_id if merchant_factor_scope == 'user' else '', transaction.merchant_id)
+
+    @staticmethod
+    def decay(since: datetime, at: datetime) -> float:
+        """Returns how much something from since counts at a later time at, which is at most 1."""
+
+        if not merchant_factor_half_life or since is None: return 1
+        return 2 ** (min(0, (since - at).total_seconds()) / 86400 / merchant_factor_half_life)
+
+    @staticmethod
+    def weight(transaction: Transaction, at: datetime) -> float:
+        """Returns the weight of a transaction in weighted totals decayed to the time at."""
+
+        return MerchantTotal.decay(transaction.datetime, at)
+
+    @staticmethod
+    def get_totals(*keys: tuple, at: datetime = None) -> dict:
+        """Returns a dictionary of (user id, merchant id): (total CO2e, total amount in pence), weighted if a half life is set,
+        with the weights decayed to the time at (by default now)."""
+
+        at = at or datetime.utcnow()
+        totals = {key: (0, 0) for key in keys}
+        for user_id in {user_id for user_id, _ in keys}:
+            merchant_ids = [merchant_id for key_user_id, merchant_id in keys if key_user_id == user_id]
+            for total in MerchantTotal.query.filter(MerchantTotal.user_id == user_id, MerchantTotal.merchant_id.in_(merchant_ids)):
+                if merchant_factor_half_life:
+                    decay = MerchantTotal.decay(total.last_updated, at)
+                    totals[(user_id, total.merchant_id)] = (total.weighted_co2e * decay, total.weighted_amount_pence * decay)
+                else: totals[(user_id, total.merchant_id)] = (total.co2e, total.amount_pence)
+
+        return totals
+
+
+    @staticmethod
+    def contribution(transaction: Transaction, co2e: float, at: datetime) -> tuple:
+        """Returns what a transaction with the given CO2e adds to its merchant's totals decayed to the time at, as
+        (count, co2e, amount, weighted co2e, weighted amount)."""
+
+        if not co2e or not transaction.amount_pence: return (0, 0, 0, 0, 0)
+
+        weight = MerchantTotal.weight(transaction, at)
+        return (1, co2e, transaction.amount_pence, weight * co2e, weight * transaction.amount_pence)
+
+    @staticmethod
+    def apply(connection, changes: dict, at: datetime) -> None:
+        """Adds (count, co2e, amount, weighted co2e, weighted amount) changes, with weights decayed to the time at, to the totals
+        of each (user id, merchant id). The weighted totals are decayed to at first, and last_updated set to it."""
+
+        changes = {key: change for key, change in changes.items() if any(change)}
+        if len(changes) == 0: return
+
+        # Read the weighted totals to decay them. The write lock is already held by the flush, so they can't change meanwhile.
+        table = MerchantTotal.__table__
+        existing = {
+            (row.user_id, row.merchant_id): row
+            for row in connection.execute(
+                table.select().where(
+                    table.c.user_id.in_({user_id for user_id, _ in changes}),
+                    table.c.merchant_id.in_({merchant_id for _, merchant_id in changes})
+                )
+            )
+        }
+
+        rows = []
+        for (user_id, merchant_id), (count, co2e, amount_pence, weighted_co2e, weighted_amount_pence) in changes.items():
+            row = existing.get((user_id, merchant_id))
+            if row is not None:
+                decay = MerchantTotal.decay(row.last_updated, at)
+                weighted_co2e += row.weighted_co2e * decay
+                weighted_amount_pence += row.weighted_amount_pence * decay
+
+            rows.append({
+                'user_id': user_id, 'merchant_id': merchant_id, 'half_life_days': merchant_factor_half_life, 'last_updated': at,
+                'count': count, 'co2e': co2e, 'amount_pence': amount_pence,
+                'weighted_co2e': max(weighted_co2e, 0), 'weighted_amount_pence': max(weighted_amount_pence, 0)
+            })
+
+        upsert = sqlite_insert(MerchantTotal)
+        connection.execute(
+            upsert.on_conflict_do_update(
+                index_elements=['user_id', 'merchant_id'],
+                set_={
+                    **{column: table.c[column] + upsert.excluded[column] for column in ('count', 'co2e', 'amount_pence')},
+                    **{column: upsert.excluded[column] for column in ('weighted_co2e', 'weighted_amount_pence', 'last_updated')}
+                }
+            ),
+            rows
+        )
+
+    @staticmethod
+    def rebuild() -> None:
+        """Recalculates every total from the transactions table. Does not commit."""
+
+        MerchantTotal.query.delete()
+        at = datetime.utcnow()
+        changes = defaultdict(lambda: (0, 0, 0, 0, 0))
+        for transaction in Transaction.query.filter(Transaction.co2e != None, Transaction.merchant_id != None):
+            contribution = MerchantTotal.contribution(transaction, transaction.co2e, at)
+            for key in MerchantTotal.keys(transaction):
+                changes[key] = tuple(map(sum, zip(changes[key], contribution)))
+
+        MerchantTotal.apply(db.session.connection(), changes, at)
+
+    @staticmethod
+    def needs_rebuild() -> bool:
+        """Returns True if the totals were kept with a different half life or weighting, or are missing for estimated transactions."""
+
+        if MerchantTotal.query.filter(MerchantTotal.half_life_days != merchant_factor_half_life).first(): return True
+        if MerchantTotal.query.filter(MerchantTotal.last_updated == None).first(): return True
+        return MerchantTotal.query.first() is None and Transaction.query.filter(Transaction.co2e != None).first() is not None
+
+
+class DailyTotal(db.Model):
+    """Daily totals of each user's estimated transactions, for the dashboard."""
+    __tablename__ = 'daily_total'
+
+    user_id = Column(String(36), primary_key=True)
+    day = Column(Date, primary_key=True)
+    count = Column(Integer, nullable=False, default=0)
+    co2e = Column(Float, nullable=False, default=0)
+    amount_pence = Column(Integer, nullable=False, default=0)
+
+
+    @staticmethod
+    def get_dashboard_totals(user_id: str, today: date = None) -> dict:
+        """Returns a user's CO2e for all time, the last 28 days, the last 7 days and the 7 days before, counting whole days up to today."""
+
+        today = today or datetime.utcnow().date()
+        windows = {
+            'all_time': DailyTotal.day.isnot(None),
+            'last_four_weeks': DailyTotal.day > today - timedelta(days=28),
+            'this_week': DailyTotal.day > today - timedelta(days=7),
+            'week_prior': (DailyTotal.day > today - timedelta(days=14)) & (DailyTotal.day <= today - timedelta(days=7)),
+        }
+
+        row = db.session.query(*(func.coalesce(func.sum(case((window, DailyTotal.co2e), else_=0)), 0) for window in windows.values())) \
+            .filter(DailyTotal.user_id == user_id).one()
+
+        return dict(zip(windows, row))
+
+
+    @staticmethod
+    def contribution(transaction: Transaction, co2e: float) -> tuple:
+        """Returns what a transaction with the given CO2e adds to its day's totals as (count, co2e, amount)."""
+
+        if co2e is None: return (0, 0, 0)
+        return (1, co2e, transaction.amount_pence)
+
+    @staticmethod
+    def apply(connection, changes: dict) -> None:
+        """Adds (count, co2e, amount) changes to the totals of each (user id, day)."""
+
+        columns = ('count', 'co2e', 'amount_pence')
+        rows = [
+            {'user_id': user_id, 'day': day, **dict(zip(columns, change))}
+            for (user_id, day), change in changes.items() if any(change)
+        ]
+        if len(rows) == 0: return
+
+        upsert = sqlite_insert(DailyTotal)
+        connection.execute(
+            upsert.on_conflict_do_update(
+                index_elements=['user_id', 'day'],
+                set_={column: DailyTotal.__table__.c[column] + upsert.excluded[column] for column in columns}
+            ),
+            rows
+        )
+
+    @staticmethod
+    def rebuild() -> None:
+        """Recalculates every daily total from the transactions table. Does not commit."""
+
+        DailyTotal.query.delete()
+        changes = defaultdict(lambda: (0, 0, 0))
+        for transaction in Transaction.query.filter(Transaction.co2e != None, Transaction.user_id != None):
+            key = (transaction.user_id, transaction.datetime.date())
+            changes[key] = tuple(map(sum, zip(changes[key], DailyTotal.contribution(transaction, transaction.co2e))))
+
+        DailyTotal.apply(db.session.connection(), changes)
+
+    @staticmethod
+    def needs_rebuild() -> bool:
+        """Returns True if there are estimated transactions but no daily totals."""
+
+        return DailyTotal.query.first() is None and Transaction.query.filter(Transaction.co2e != None).first() is not None
+
+
+@event.listens_for(Session, 'after_flush')
+def update_totals(session, flush_context):
+    """Updates merchant and daily totals by the change in CO2e of every transaction written, deleted or re-estimated in a flush."""
+
+    at = datetime.utcnow()
+    merchant_changes = defaultdict(lambda: (0, 0, 0, 0, 0))
+    daily_changes = defaultdict(lambda: (0, 0, 0))
+    for transaction in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(transaction, Transaction): continue
+
+        history = inspect(transaction).attrs.co2e.history
+        if transaction in session.deleted:
+            old_co2e, new_co2e = transaction.co2e, None
+        elif history.has_changes():
+            old_co2e = history.deleted[0] if history.deleted else None
+            new_co2e = history.added[0] if history.added else None
+        else: continue
+
+        if transaction.merchant_id is not None:
+            old = MerchantTotal.contribution(transaction, old_co2e, at)
+            new = MerchantTotal.contribution(transaction, new_co2e, at)
+            for key in MerchantTotal.keys(transaction):
+                merchant_changes[key] = tuple(total + added - removed for total, added, removed in zip(merchant_changes[key], new, old))
+
+        if transaction.user_id is not None:
+            old = DailyTotal.contribution(transaction, old_co2e)
+            new = DailyTotal.contribution(transaction, new_co2e)
+            key = (transaction.user_id, transaction.datetime.date())
+            daily_changes[key] = tuple(total + added - removed for total, added, removed in zip(daily_changes[key], new, old))
+
+    MerchantTotal.apply(session.connection(), merchant_changes, at)
+    DailyTotal.apply(session.connection(), daily_changes)
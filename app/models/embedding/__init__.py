@@ -1,17 +1,25 @@
-import os
-from .e5 import E5
-from .gtr_t5 import GTR_T5
-from .instructor import Instructor
-from .sentence_t5 import SentenceT5
+import os, pathlib
+from ast import literal_eval
+from ._lazy import LazyModel, registry
+from ._cache import EmbeddingCache
+from ._remote import RemoteModel
+from ._executor import InferenceExecutor
+from ._interface import inference_concurrency
 
-match os.getenv('MODEL'):
-    case 'e5':
-        model = E5()
-    case 'gtr_t5':
-        model = GTR_T5()
-    case 'sentence_t5':
-        model = SentenceT5()
-    case 'instructor':
-        model = Instructor()
-    case _:
-        raise ValueError('MODEL environment variable must be one of e5, gtr_t5, sentence_t5, or instructor')
+# Use a shared embedding server if one is configured, which is expected to serve MODEL if that is set. Otherwise the model is
+# loaded in this process, the first time embeddings are requested or at startup if EMBEDDING_WARMUP is set, and requests
+# from every thread queue to run it.
+if os.getenv('EMBEDDING_SERVER'):
+    model = RemoteModel(
+        os.getenv('EMBEDDING_SERVER'), timeout=float(os.getenv('EMBEDDING_SERVER_TIMEOUT', 60)),
+        name=os.getenv('MODEL') if os.getenv('MODEL') in registry else None, version=os.getenv('MODEL_VERSION')
+    )
+elif os.getenv('MODEL') in registry:
+    model = InferenceExecutor(LazyModel(os.getenv('MODEL'), os.getenv('MODEL_VERSION')), inference_concurrency)
+else:
+    raise ValueError('MODEL environment variable must be one of e5, gtr_t5, sentence_t5, or instructor')
+
+# Persistent embedding cache, invalidated when the model or its version changes.
+if literal_eval(os.getenv('EMBEDDING_CACHE', 'True')):
+    cache_path = os.getenv('EMBEDDING_CACHE_PATH', str(pathlib.Path(__file__).parent.parent.parent / '.embedding_cache.db'))
+    model = EmbeddingCache(model, cache_path, capacity=int(os.getenv('EMBEDDING_CACHE_SIZE', 4096)), precision=os.getenv('EMBEDDING_CACHE_PRECISION', 'float32'))
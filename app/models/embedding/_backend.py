@@ -0,0 +1,95 @@
+import os, pathlib
+import numpy as np
+import torch
+if __package__:
+    from ._interface import inference_concurrency, inference_threads
+else:
+    from _interface import inference_concurrency, inference_threads
+
+# Intra-op threads per forward pass, so that the passes allowed to run at once use about one thread per core between them.
+threads_per_inference = inference_threads or max(1, torch.get_num_threads() // inference_concurrency)
+
+# Directory that exported ONNX models are kept in, one file per model key.
+onnx_path = os.getenv('EMBEDDING_ONNX_PATH', str(pathlib.Path(__file__).parent.parent.parent / '.onnx'))
+
+
+def set_torch_threads() -> None:
+    """Sets the number of intra-op threads torch uses for each forward pass."""
+
+    torch.set_num_threads(threads_per_inference)
+
+
+def quantise_dynamic(module: torch.nn.Module) -> torch.nn.Module:
+    """Returns a module with its linear layers replaced by int8 ones, whose activations are quantised as they run."""
+
+    return torch.quantization.quantize_dynamic(module.eval(), {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxEncoder:
+    """Hugging Face transformer encoder run by ONNX Runtime. Takes token ids and an attention mask, and returns the last hidden state.
+
+    The encoder is exported from its PyTorch module the first time it is used with a key, and loaded from onnx_path after that.
+    """
+
+    def __init__(self, module: torch.nn.Module, key: str) -> None:
+        """Loads the ONNX export of module saved under key, exporting it first if there is none."""
+
+        try:
+            import onnxruntime
+        except ImportError:
+            raise ImportError('the onnx embedding backend requires onnxruntime, e.g. pip install onnxruntime')
+
+        self.path = os.path.join(onnx_path, f'{key}.onnx')
+        if not os.path.exists(self.path): OnnxEncoder.export(module, self.path)
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        options.intra_op_num_threads = threads_per_inference
+        self.session = onnxruntime.InferenceSession(self.path, options, providers=['CPUExecutionProvider'])
+
+    def __call__(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+        """Returns the last hidden state of a batch of tokenised texts."""
+
+        inputs = {'input_ids': input_ids.numpy().astype(np.int64), 'attention_mask': attention_mask.numpy().astype(np.int64)}
+        return torch.from_numpy(self.session.run(['last_hidden_state'], inputs)[0])
+
+
+    @staticmethod
+    def export(module: torch.nn.Module, path: str) -> None:
+        """Exports a transformer encoder to an ONNX file, with dynamic batch and sequence lengths."""
+
+        class Encoder(torch.nn.Module):
+            def __init__(self, module: torch.nn.Module) -> None:
+                super().__init__()
+                self.module = module
+
+            def forward(self, input_ids: torch.Tensor, attention_mask: torch.Tensor) -> torch.Tensor:
+                return self.module(input_ids=input_ids, attention_mask=attention_mask)[0]
+
+        print(f'Exporting {path}...')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # Export to a temporary file first, so an interrupted export is not loaded later.
+        example = torch.ones((1, 8), dtype=torch.long)
+        axes = {0: 'batch', 1: 'sequence'}
+        with torch.no_grad():
+            torch.onnx.export(
+                Encoder(module.eval()), (example, example), f'{path}.tmp',
+                input_names=['input_ids', 'attention_mask'], output_names=['last_hidden_state'],
+                dynamic_axes={'input_ids': axes, 'attention_mask': axes, 'last_hidden_state': axes},
+                opset_version=14
+            )
+        os.replace(f'{path}.tmp', path)
+
+
+def encode_sentence_transformer(model, encoder: OnnxEncoder, texts: list) -> list:
+    """Embeds texts with a SentenceTransformer whose transformer runs as an OnnxEncoder. Its remaining modules, such as pooling,
+    dense layers and normalisation, are cheap so still run in PyTorch."""
+
+    features = model.tokenize(texts)
+    features['token_embeddings'] = encoder(features['input_ids'], features['attention_mask'])
+
+    with torch.inference_mode():
+        for module in list(model)[1:]: features = module(features)
+
+    return features['sentence_embedding'].tolist()
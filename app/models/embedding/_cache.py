@@ -0,0 +1,169 @@
+import sqlite3, threading
+from collections import OrderedDict
+import numpy as np
+if __package__:
+    from ._interface import EmbeddingModelInterface, normalise_text
+    from ._quantise import quantise, dequantise, precisions
+else:
+    from _interface import EmbeddingModelInterface, normalise_text
+    from _quantise import quantise, dequantise, precisions
+
+
+class EmbeddingCache(EmbeddingModelInterface):
+    """Caches a model's item embeddings in an in-memory LRU tier in front of a persistent SQLite table.
+
+    Entries are keyed by the model key (class and version) and the normalised item text. Entries for any other model key
+    are deleted when the cache is opened, so changing MODEL or the model version invalidates the cache.
+
+    Both tiers hold embeddings as blobs at the cache's precision. int8 blobs start with the vector's float32 scale. Entries
+    are keyed by precision too, so changing it also invalidates the cache.
+    """
+
+    def __repr__(self) -> str:
+        return repr(self.model)
+
+    def __init__(self, model: EmbeddingModelInterface, path: str, capacity: int = 4096, precision: str = 'float32') -> None:
+        """Opens the cache database at path for the given model, storing embeddings at precision."""
+
+        if not isinstance(model, EmbeddingModelInterface): raise TypeError('model must implement EmbeddingModelInterface')
+        if not isinstance(path, str): raise TypeError('path must be a string')
+        if capacity < 0: raise ValueError('capacity must not be negative')
+        if precision not in precisions: raise ValueError(f'precision must be one of {", ".join(precisions)}')
+
+        self.model = model
+        self.path = path
+        self.capacity = capacity
+        self.precision = precision
+        self.hits = 0
+        self.misses = 0
+
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._connection:
+            self._connection.execute('CREATE TABLE IF NOT EXISTS embedding (model TEXT NOT NULL, text TEXT NOT NULL, vector BLOB NOT NULL, PRIMARY KEY (model, text))')
+            self._connection.execute('DELETE FROM embedding WHERE model != ?', (self.entry_key,))
+
+    @property
+    def versions(self) -> tuple:
+        return self.model.versions
+
+    @property
+    def version(self) -> str:
+        return self.model.version
+
+    @property
+    def backend(self) -> str:
+        return self.model.backend
+
+    @property
+    def entry_key(self) -> str:
+        """The model key entries are stored under, with the precision if it is not float32."""
+
+        return self.key if self.precision == 'float32' else f'{self.key}-{self.precision}'
+
+
+    def get_embeddings(self, string: str, *args: str) -> list:
+        """Get the embeddings of texts. A single item text is served from the cache, anything else is passed to the model."""
+
+        if args: return self.model.get_embeddings(string, *args)
+        return self.get_embeddings_batch([string])
+
+
+    def get_embeddings_batch(self, items: list, batch_size: int = None) -> list:
+        """Get the embeddings of many item texts, only embedding texts that are not already cached."""
+
+        if not isinstance(items, list): raise TypeError('items must be a list')
+        if not all(isinstance(item, str) for item in items): raise TypeError('items must be strings')
+
+        texts = [normalise_text(item) for item in items]
+        found = self._get(list(dict.fromkeys(texts)))
+
+        missing = [text for text in dict.fromkeys(texts) if text not in found]
+        if missing:
+            embedded = self.model.get_embeddings_batch(missing, batch_size)
+            found.update(self._put(dict(zip(missing, embedded))))
+
+        return [found[text].tolist() for text in texts]
+
+
+    def warm_up(self) -> None:
+        """Warms up the underlying model."""
+
+        self.model.warm_up()
+
+
+    def stats(self) -> dict:
+        """Returns the hit and miss counters and the number of entries in each tier."""
+
+        with self._lock:
+            stored = self._connection.execute('SELECT COUNT(*) FROM embedding WHERE model = ?', (self.entry_key,)).fetchone()[0]
+            return {'hits': self.hits, 'misses': self.misses, 'memory': len(self._memory), 'stored': stored}
+
+    def clear(self) -> None:
+        """Deletes every cached embedding."""
+
+        with self._lock, self._connection:
+            self._memory.clear()
+            self._connection.execute('DELETE FROM embedding')
+
+
+    def encode(self, vector: list) -> bytes:
+        """Returns the blob of an embedding at the cache's precision."""
+
+        codes, scales = quantise(np.asarray(vector, dtype=np.float32)[np.newaxis], self.precision)
+        return (scales.tobytes() if self.precision == 'int8' else b'') + codes.tobytes()
+
+    def decode(self, blob: bytes) -> np.ndarray:
+        """Returns the float32 embedding of a blob."""
+
+        if self.precision == 'int8': return dequantise(np.frombuffer(blob, dtype=np.int8, offset=4)[np.newaxis], np.frombuffer(blob, dtype=np.float32, count=1))[0]
+        return np.frombuffer(blob, dtype=self.precision).astype(np.float32, copy=False)
+
+
+    def _get(self, texts: list) -> dict:
+        """Looks texts up in memory, then in the database. Returns a dictionary of the texts that were found."""
+
+        found = {}
+        with self._lock:
+            for text in texts:
+                if text in self._memory:
+                    self._memory.move_to_end(text)
+                    found[text] = self.decode(self._memory[text])
+
+            stored = [text for text in texts if text not in found]
+            for start in range(0, len(stored), 500):
+                chunk = stored[start:start + 500]
+                rows = self._connection.execute(
+                    f'SELECT text, vector FROM embedding WHERE model = ? AND text IN ({",".join("?" * len(chunk))})',
+                    (self.entry_key, *chunk)
+                )
+                for text, blob in rows:
+                    found[text] = self.decode(blob)
+                    self._remember(text, blob)
+
+            self.hits += len(found)
+            self.misses += len(texts) - len(found)
+
+        return found
+
+    def _put(self, embeddings: dict) -> dict:
+        """Stores new embeddings in both tiers. Returns them as float32 arrays, as they will be read back from the cache."""
+
+        blobs = {text: self.encode(embedding) for text, embedding in embeddings.items()}
+        with self._lock, self._connection:
+            self._connection.executemany(
+                'INSERT OR REPLACE INTO embedding (model, text, vector) VALUES (?, ?, ?)',
+                [(self.entry_key, text, blob) for text, blob in blobs.items()]
+            )
+            for text, blob in blobs.items(): self._remember(text, blob)
+
+        return {text: self.decode(blob) for text, blob in blobs.items()}
+
+    def _remember(self, text: str, blob: bytes) -> None:
+        """Adds an embedding blob to the memory tier, evicting the least recently used entry if it is full."""
+
+        self._memory[text] = blob
+        self._memory.move_to_end(text)
+        while len(self._memory) > self.capacity: self._memory.popitem(last=False)
@@ -0,0 +1,115 @@
+import threading, time
+if __package__:
+    from ._interface import EmbeddingModelInterface, default_batch_size
+else:
+    from _interface import EmbeddingModelInterface, default_batch_size
+
+
+class InferenceExecutor(EmbeddingModelInterface):
+    """Runs a model's forward passes with at most concurrency of them at once, so that concurrent requests do not each start
+    a full pool of threads and oversubscribe the cores. Further callers queue, and are let in in the order they arrived.
+
+    Batches are split into forward passes of up to batch_size texts, each of which queues on its own, so one large batch
+    can not hold up other callers for longer than a forward pass.
+    """
+
+    def __repr__(self) -> str:
+        return repr(self.model)
+
+    def __init__(self, model: EmbeddingModelInterface, concurrency: int = 1) -> None:
+        """Wraps a model, allowing concurrency forward passes to run at once."""
+
+        if not isinstance(model, EmbeddingModelInterface): raise TypeError('model must implement EmbeddingModelInterface')
+        if concurrency < 1: raise ValueError('concurrency must be at least 1')
+
+        self.model = model
+        self.concurrency = concurrency
+        self.running = 0
+        self.waiting = 0
+        self.completed = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+        self._condition = threading.Condition()
+        self._next_ticket = 0   # ticket of the next caller to queue
+        self._serving = 0       # ticket of the next caller to be let in
+
+    @property
+    def versions(self) -> tuple:
+        return self.model.versions
+
+    @property
+    def version(self) -> str:
+        return self.model.version
+
+    @property
+    def backend(self) -> str:
+        return self.model.backend
+
+
+    def get_embeddings(self, string: str, *args: str) -> list:
+        """Get the embeddings of texts in one forward pass, once it is this caller's turn."""
+
+        return self._run(self.model.get_embeddings, string, *args)
+
+    def get_embeddings_batch(self, items: list, batch_size: int = None) -> list:
+        """Get the embeddings of many item texts, queueing for each forward pass of at most batch_size texts."""
+
+        if not isinstance(items, list): raise TypeError('items must be a list')
+        if not all(isinstance(item, str) for item in items): raise TypeError('items must be strings')
+        batch_size = batch_size or default_batch_size
+        if batch_size < 1: raise ValueError('batch_size must be at least 1')
+
+        embeddings = []
+        for start in range(0, len(items), batch_size):
+            embeddings += self._run(self.model.get_embeddings_batch, items[start:start + batch_size], batch_size)
+
+        return embeddings
+
+    def warm_up(self) -> None:
+        """Warms up the underlying model, in turn with any inferences already queued."""
+
+        self._run(self.model.warm_up)
+
+
+    def stats(self) -> dict:
+        """Returns the forward passes running, waiting and completed, and the mean and longest seconds spent waiting."""
+
+        with self._condition:
+            return {
+                'running': self.running,
+                'waiting': self.waiting,
+                'completed': self.completed,
+                'mean_wait_seconds': self.wait_seconds / (self.running + self.completed) if self.running + self.completed else 0,
+                'max_wait_seconds': self.max_wait_seconds
+            }
+
+
+    def _run(self, function: callable, *args):
+        """Calls function once a slot is free and every earlier caller has been let in. Returns its result."""
+
+        queued = time.monotonic()
+        with self._condition:
+            ticket = self._next_ticket
+            self._next_ticket += 1
+            self.waiting += 1
+
+            self._condition.wait_for(lambda: self._serving == ticket and self.running < self.concurrency)
+
+            waited = time.monotonic() - queued
+            self._serving += 1
+            self.waiting -= 1
+            self.running += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+            # The next caller may fit in another free slot.
+            self._condition.notify_all()
+
+        try:
+            return function(*args)
+        finally:
+            with self._condition:
+                self.running -= 1
+                self.completed += 1
+                self._condition.notify_all()
@@ -0,0 +1,323 @@
+import numpy as np
+import hashlib, zipfile
+from abc import ABC, abstractmethod
+from scipy.sparse import csr_matrix
+if __package__:
+    from ._quantise import quantise
+else:
+    from _quantise import quantise
+
+# Increment when the layout of saved indexes changes.
+index_format = 2
+
+
+class VectorIndex(ABC):
+    """Index of category vectors for nearest-category lookup by cosine similarity.
+
+    Backends hold the vectors as a matrix of L2-normalised rows, quantised to float32, float16 or int8 codes with a scale
+    per row, and the names and factors in parallel arrays in category order. The arrays named in persisted are saved and
+    loaded with the index.
+
+    A quantised index can rescore the best rescore candidates of each search with their full precision vectors, which
+    full_vectors returns for a list of category names, so only the candidates' vectors are held in full at once.
+    """
+
+    backend = ''
+    persisted = ()
+
+    def __init__(self, names: list, factors: list, rescore: int = 0, full_vectors: callable = None) -> None:
+        """Sets the category names and emission factors, and how candidates are rescored."""
+
+        if not len(names) == len(factors): raise ValueError('names and factors must be the same length')
+        if len(names) == 0: raise ValueError('index must contain at least one category')
+        if rescore < 0: raise ValueError('rescore must not be negative')
+
+        self.names = np.array(names, dtype=object)
+        self.factors = np.array(factors, dtype=np.float64)
+        self.rescore = rescore
+        self.full_vectors = full_vectors
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @property
+    def precision(self) -> str:
+        return str(self.matrix.dtype)
+
+
+    @abstractmethod
+    def candidates(self, queries: np.ndarray, k: int) -> tuple:
+        """Returns the positions of the k most similar categories found to each normalised query, and their similarities,
+        as arrays with a row per query, most similar first."""
+        pass
+
+    def search_top_k(self, vectors: list, k: int = 1) -> tuple:
+        """Returns the k most similar categories to each of several vectors as (names, cosine similarities, factors), each an
+        array with a row per vector of up to k columns, most similar first."""
+
+        queries = VectorIndex.normalise(np.asarray(vectors, dtype=np.float32).reshape(len(vectors), -1))
+        k = min(k, len(self))
+
+        if self.rescore and self.full_vectors is not None and self.precision != 'float32':
+            categories, scores = self.refine(queries, self.candidates(queries, min(max(k, self.rescore), len(self)))[0], k)
+        else:
+            categories, scores = self.candidates(queries, k)
+
+        return self.names[categories], scores, self.factors[categories]
+
+    def search_batch(self, vectors: list) -> list:
+        """Returns the most similar category to each of several vectors as a list of (name, cosine similarity, factor)."""
+
+        if len(vectors) == 0: return []
+
+        names, scores, factors = self.search_top_k(vectors, 1)
+        return [(name, float(score), float(factor)) for name, score, factor in zip(names[:, 0], scores[:, 0], factors[:, 0])]
+
+    def search(self, vector: list) -> tuple:
+        """Returns the most similar category to a vector as (name, cosine similarity, factor)."""
+
+        return self.search_batch([vector])[0]
+
+
+    def save(self, path: str, fingerprint: str = '') -> None:
+        """Writes the index to a .npz file, tagged with a fingerprint of the categories it was built from."""
+
+        np.savez(
+            path,
+            format=np.array(index_format),
+            backend=np.array(self.backend),
+            fingerprint=np.array(fingerprint),
+            names=np.array(self.names.tolist(), dtype=str),
+            factors=self.factors,
+            **{name: getattr(self, name) for name in self.persisted}
+        )
+
+    @staticmethod
+    def load(path: str, fingerprint: str = None) -> 'VectorIndex':
+        """Reads an index saved by save. Raises a ValueError if it is a different format or backend, was built from other
+        categories, or is not an index."""
+
+        try:
+            with np.load(path, allow_pickle=False) as saved:
+                if int(saved['format']) != index_format: raise ValueError(f'{path} is index format {int(saved["format"])}, expected {index_format}')
+                if fingerprint is not None and str(saved['fingerprint']) != fingerprint: raise ValueError(f'{path} was built from different categories')
+
+                cls = next((cls for cls in (CategoryIndex, IVFIndex) if cls.backend == str(saved['backend'])), None)
+                if cls is None: raise ValueError(f'{path} is an index of unknown backend {saved["backend"]}')
+
+                index = cls.__new__(cls)
+                VectorIndex.__init__(index, saved['names'].tolist(), saved['factors'])
+                for name in cls.persisted: setattr(index, name, saved[name])
+
+        # A truncated file, or an .npz written by something else.
+        except (KeyError, zipfile.BadZipFile, EOFError) as e:
+            raise ValueError(f'{path} is not an index: {e!r}')
+
+        return index
+
+    @staticmethod
+    def fingerprint(*parts) -> str:
+        """Returns a hash of the categories, and any options, an index is built from."""
+
+        digest = hashlib.sha1()
+        for part in parts:
+            if isinstance(part, np.ndarray): digest.update(np.ascontiguousarray(part).tobytes())
+            else: digest.update(repr(part).encode())
+        return digest.hexdigest()
+
+
+    def scores(self, queries: np.ndarray, start: int = 0, end: int = None, chunk_size: int = 4096) -> np.ndarray:
+        """Returns the similarities of normalised queries to rows start to end of the matrix, with a row per query. Quantised
+        rows are converted to float32 in chunks, to bound memory."""
+
+        end = len(self.matrix) if end is None else end
+        if self.precision == 'float32': return queries @ self.matrix[start:end].T
+
+        return np.concatenate([
+            (queries @ self.matrix[chunk:min(chunk + chunk_size, end)].T.astype(np.float32)) * self.scales[chunk:min(chunk + chunk_size, end)]
+            for chunk in range(start, end, chunk_size)
+        ], axis=1)
+
+    def refine(self, queries: np.ndarray, categories: np.ndarray, k: int) -> tuple:
+        """Rescores each query's candidate category positions against their full precision vectors. Returns the positions of
+        the k best and their similarities."""
+
+        unique, inverse = np.unique(categories, return_inverse=True)
+        vectors = VectorIndex.normalise(np.asarray(self.full_vectors(self.names[unique].tolist()), dtype=np.float32))
+
+        scores = np.einsum('qd,qcd->qc', queries, vectors[inverse.reshape(categories.shape)])
+        top, scores = VectorIndex.top_k(scores, k)
+        return np.take_along_axis(categories, top, axis=1), scores
+
+
+    @staticmethod
+    def top_k(scores: np.ndarray, k: int) -> tuple:
+        """Returns the columns of the k highest scores in each row of a matrix, and those scores, highest first."""
+
+        k = min(k, scores.shape[1])
+        if k == 1:
+            top = scores.argmax(axis=1)[:, np.newaxis]
+        else:
+            top = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            top = np.take_along_axis(top, np.argsort(-np.take_along_axis(scores, top, axis=1), axis=1, kind='stable'), axis=1)
+
+        return top, np.take_along_axis(scores, top, axis=1)
+
+    @staticmethod
+    def normalise(vectors: np.ndarray) -> np.ndarray:
+        """L2-normalises a vector, or each row of a matrix. Zero vectors are left as zeros."""
+
+        norms = np.linalg.norm(vectors, axis=-1, keepdims=True)
+        norms[norms == 0] = 1
+        return np.ascontiguousarray(vectors / norms, dtype=np.float32)
+
+
+class CategoryIndex(VectorIndex):
+    """Exact in-memory index of category vectors.
+
+    Vectors are held as one contiguous matrix of L2-normalised rows, with names and factors in parallel arrays, so the
+    cosine similarity against every category is a single matrix-vector product.
+    """
+
+    backend = 'exact'
+    persisted = ('matrix', 'scales')
+
+    def __init__(self, names: list, factors: list, vectors: list, precision: str = 'float32', rescore: int = 0, full_vectors: callable = None) -> None:
+        """Builds the index from parallel lists of category names, emission factors and vectors, held at precision."""
+
+        if not len(names) == len(vectors): raise ValueError('names, factors and vectors must be the same length')
+        super().__init__(names, factors, rescore, full_vectors)
+
+        self.matrix, self.scales = quantise(CategoryIndex.normalise(np.asarray(vectors, dtype=np.float32)), precision)
+
+    def __repr__(self) -> str:
+        return f'CategoryIndex({len(self)} categories, {self.matrix.shape[1]} dimensions, {self.precision})'
+
+
+    def similarities(self, vector: list) -> np.ndarray:
+        """Returns the cosine similarity of a vector to every category, in index order."""
+
+        query = CategoryIndex.normalise(np.asarray(vector, dtype=np.float32))
+        return self.scores(query[np.newaxis])[0]
+
+    def candidates(self, queries: np.ndarray, k: int) -> tuple:
+        """Returns the positions and similarities of the k most similar categories to each normalised query."""
+
+        return CategoryIndex.top_k(self.scores(queries), k)
+
+
+class IVFIndex(VectorIndex):
+    """Approximate index for large category tables.
+
+    The vectors are clustered around k-means centroids into inverted lists, stored contiguously in list order. A query
+    scans only the lists whose centroids are most similar to it, so recall and cost both rise with the number of probes.
+    """
+
+    backend = 'ivf'
+    persisted = ('matrix', 'scales', 'order', 'offsets', 'centroids')
+
+    # Lists scanned per query by a loaded index, unless set after loading.
+    probes = 8
+
+    def __init__(self, names: list, factors: list, vectors: list, lists: int = 0, probes: int = 8, iterations: int = 10, seed: int = 0,
+                 precision: str = 'float32', rescore: int = 0, full_vectors: callable = None) -> None:
+        """Builds the index, with lists clusters, or about the square root of the number of categories if lists is 0. The
+        clusters are found at full precision, and the vectors then held at precision."""
+
+        if not len(names) == len(vectors): raise ValueError('names, factors and vectors must be the same length')
+        if probes < 1: raise ValueError('probes must be at least 1')
+        super().__init__(names, factors, rescore, full_vectors)
+
+        matrix = IVFIndex.normalise(np.asarray(vectors, dtype=np.float32))
+        lists = min(lists or int(np.sqrt(len(matrix))), len(matrix))
+
+        self.centroids = IVFIndex.kmeans(matrix, lists, iterations, seed)
+        assignment = IVFIndex.nearest(matrix, self.centroids)
+
+        # Row i of the matrix is category order[i]. List l holds rows offsets[l] to offsets[l + 1].
+        self.order = np.argsort(assignment, kind='stable')
+        self.matrix, self.scales = quantise(matrix[self.order], precision)
+        self.offsets = np.searchsorted(assignment[self.order], np.arange(lists + 1))
+        self.probes = probes
+
+    def __repr__(self) -> str:
+        return f'IVFIndex({len(self)} categories, {self.matrix.shape[1]} dimensions, {self.precision}, {len(self.centroids)} lists, {self.probes} probes)'
+
+
+    def candidates(self, queries: np.ndarray, k: int) -> tuple:
+        """Returns the positions and similarities of the k most similar categories found to each normalised query in its probed lists."""
+
+        probes = min(self.probes, len(self.centroids))
+        probed = np.argpartition(-(queries @ self.centroids.T), probes - 1, axis=1)[:, :probes]
+
+        # Scan each probed list once, for every query that probes it, merging its best rows into each query's k best so far.
+        best_scores = np.full((len(queries), k), -np.inf, dtype=np.float32)
+        best_rows = np.full((len(queries), k), -1, dtype=np.int64)
+        for l in np.unique(probed):
+            start, end = self.offsets[l], self.offsets[l + 1]
+            if start == end: continue
+
+            members = np.flatnonzero((probed == l).any(axis=1))
+            scores = np.concatenate([best_scores[members], self.scores(queries[members], start, end)], axis=1)
+            rows = np.concatenate([best_rows[members], np.broadcast_to(np.arange(start, end), (len(members), end - start))], axis=1)
+
+            top, best_scores[members] = IVFIndex.top_k(scores, k)
+            best_rows[members] = np.take_along_axis(rows, top, axis=1)
+
+        # Queries whose probed lists held fewer than k categories are compared with every category.
+        short = np.flatnonzero((best_rows < 0).any(axis=1))
+        if len(short) > 0:
+            best_rows[short], best_scores[short] = IVFIndex.top_k(self.scores(queries[short]), k)
+
+        return self.order[best_rows], best_scores
+
+
+    @staticmethod
+    def nearest(matrix: np.ndarray, centroids: np.ndarray, chunk_size: int = 4096) -> np.ndarray:
+        """Returns the index of the most similar centroid to each row, in chunks to bound memory."""
+
+        return np.concatenate([(matrix[start:start + chunk_size] @ centroids.T).argmax(axis=1) for start in range(0, len(matrix), chunk_size)])
+
+    @staticmethod
+    def kmeans(matrix: np.ndarray, k: int, iterations: int = 10, seed: int = 0) -> np.ndarray:
+        """Returns k unit centroids of normalised rows by spherical k-means, seeded from random rows."""
+
+        rng = np.random.default_rng(seed)
+        centroids = matrix[rng.choice(len(matrix), k, replace=False)]
+
+        for _ in range(iterations):
+            assignment = IVFIndex.nearest(matrix, centroids)
+            members = csr_matrix((np.ones(len(matrix), dtype=np.float32), (assignment, np.arange(len(matrix)))), shape=(k, len(matrix)))
+            sums = np.asarray(members @ matrix)
+
+            # Keep the previous centroid of any cluster left empty.
+            empty = np.asarray(members.sum(axis=1)).ravel() == 0
+            sums[empty] = centroids[empty]
+            centroids = IVFIndex.normalise(sums)
+
+        return centroids
+
+
+def build_index(backend: str, names: list, factors: list, vectors: list, path: str = None, lists: int = 0, probes: int = 8,
+                precision: str = 'float32', rescore: int = 0, full_vectors: callable = None) -> VectorIndex:
+    """Returns an exact or ivf index of the categories held at precision. An ivf index is loaded from path if it was saved
+    there for the same categories, number of lists and precision, and otherwise built and saved there. The exact index is
+    cheap to build, so is not saved."""
+
+    if backend == 'exact': return CategoryIndex(names, factors, vectors, precision, rescore, full_vectors)
+    if backend != 'ivf': raise ValueError('backend must be exact or ivf')
+
+    vectors = np.asarray(vectors, dtype=np.float32)
+    fingerprint = VectorIndex.fingerprint(backend, lists, precision, names, np.asarray(factors, dtype=np.float64), vectors)
+
+    if path:
+        try:
+            index = VectorIndex.load(path, fingerprint)
+            index.probes, index.rescore, index.full_vectors = probes, rescore, full_vectors
+            return index
+        except (OSError, ValueError):
+            pass
+
+    index = IVFIndex(names, factors, vectors, lists, probes, precision=precision, rescore=rescore, full_vectors=full_vectors)
+    if path: index.save(path, fingerprint)
+    return index
@@ -1,19 +1,75 @@
+import os
 from abc import ABC, abstractmethod
 from scipy.spatial.distance import cosine
+if __package__:
+    from ._index import CategoryIndex
+else:
+    from _index import CategoryIndex
+
+# Maximum number of texts encoded in one forward pass by get_embeddings_batch.
+default_batch_size = int(os.getenv('EMBEDDING_BATCH_SIZE', 32))
+
+# How models run inference: torch (PyTorch in eager mode), int8 (PyTorch with linear layers dynamically quantised to
+# int8) or onnx (the model's transformer exported to ONNX and run by ONNX Runtime, which must be installed).
+backends = ('torch', 'int8', 'onnx')
+default_backend = os.getenv('EMBEDDING_BACKEND', 'torch')
+if default_backend not in backends: raise ValueError(f'EMBEDDING_BACKEND must be one of {", ".join(backends)}')
+
+# Forward passes that run at once in a process. Callers beyond this queue for their turn.
+inference_concurrency = int(os.getenv('EMBEDDING_CONCURRENCY', 1))
+
+# Intra-op threads used by each forward pass, or 0 to share the framework's default of one per core between them.
+inference_threads = int(os.getenv('EMBEDDING_THREADS', 0))
+
+
+def normalise_text(text: str) -> str:
+    """Normalises item text for use as a lookup key by collapsing whitespace. Case is kept as some models are case-sensitive."""
+
+    return ' '.join(text.split())
+
 
 class EmbeddingModelInterface(ABC):
     """Embedding model for comparing texts."""
 
     versions = ()
+    version = ''
+    backend = 'torch'
 
     @abstractmethod
     def __init__(self, version: str = ''):
         pass
 
+    @property
+    def key(self) -> str:
+        """Identifies the model, version and backend that produced an embedding, e.g. 'E5-large' or 'E5-large-int8'. Embeddings
+        are only comparable within a key."""
+
+        return f'{self!r}-{self.version}' if self.backend == 'torch' else f'{self!r}-{self.version}-{self.backend}'
+
     @abstractmethod
     def get_embeddings(self, item: str, *categories: str) -> list:
         pass
 
+    def warm_up(self) -> None:
+        """Runs one embedding so that the first real request does not pay for any deferred initialisation."""
+
+        self.get_embeddings('warm up')
+
+    def get_embeddings_batch(self, items: list, batch_size: int = None) -> list:
+        """Get the embeddings of many item texts, encoding at most batch_size texts per forward pass. Embeddings are returned in input order."""
+
+        if not isinstance(items, list): raise TypeError('items must be a list')
+        if not all(isinstance(item, str) for item in items): raise TypeError('items must be strings')
+        batch_size = batch_size or default_batch_size
+        if batch_size < 1: raise ValueError('batch_size must be at least 1')
+
+        embeddings = []
+        for start in range(0, len(items), batch_size):
+            embeddings += self.get_embeddings(*items[start:start + batch_size])
+
+        return embeddings
+
+
     def get_item_from_strings(self, compare_this: str, to_this: str, *and_this: str, get_all_cosines: bool = False) -> tuple:
         """Takes a target string and n strings to compare it to, and returns the most similar string and its cosine similarity."""
 
@@ -45,16 +101,11 @@ class EmbeddingModelInterface(ABC):
         if not isinstance(to_this, tuple): raise TypeError('to_this must be a tuple with (category_name, vector)')
         if not all(isinstance(arg, tuple) for arg in and_this): raise TypeError('and_this must be a tuple with (category_name, vector)')
 
-        cosines = {}
-
-        counter = 0
         compare_to = [to_this] + [arg for arg in and_this]
+        index = CategoryIndex([arg[0] for arg in compare_to], [0] * len(compare_to), [arg[1] for arg in compare_to])
+        scores = index.similarities(compare_this)
 
-        for to_this in compare_to:
-            cosines[to_this[0]] = 1 - cosine(compare_this, to_this[1])
-            counter += 1
-
-        if get_all_cosines: return cosines
+        if get_all_cosines: return {name: float(score) for name, score in zip(index.names, scores)}
 
-        most_similar = max(cosines, key=cosines.get)
-        return (most_similar, cosines[most_similar])
+        most_similar = int(scores.argmax())
+        return (index.names[most_similar], float(scores[most_similar]))
@@ -0,0 +1,69 @@
+import threading
+from importlib import import_module
+if __package__:
+    from ._interface import EmbeddingModelInterface, default_backend
+else:
+    from _interface import EmbeddingModelInterface, default_backend
+
+
+# MODEL environment variable values: (module, class, default version).
+registry = {
+    'e5': ('e5', 'E5', 'large'),
+    'gtr_t5': ('gtr_t5', 'GTR_T5', 'xxl'),
+    'sentence_t5': ('sentence_t5', 'SentenceT5', 'xxl'),
+    'instructor': ('instructor', 'Instructor', 'xl'),
+}
+
+
+class LazyModel(EmbeddingModelInterface):
+    """Stands in for an embedding model, only importing it and loading its weights the first time embeddings are requested."""
+
+    def __repr__(self) -> str:
+        return self.class_name
+
+    def __init__(self, name: str, version: str = None, backend: str = default_backend) -> None:
+        """Selects a model from the registry by its MODEL name, and the backend to run it with, without loading it."""
+
+        if name not in registry: raise ValueError(f'model must be one of {", ".join(registry)}')
+
+        self.module, self.class_name, default_version = registry[name]
+        self.version = version or default_version
+        self.backend = backend
+        self._model = None
+        self._lock = threading.Lock()
+
+    @property
+    def versions(self) -> tuple:
+        return self.model.versions
+
+    @property
+    def loaded(self) -> bool:
+        return self._model is not None
+
+    @property
+    def model(self) -> EmbeddingModelInterface:
+        """The underlying model, which is loaded on first access."""
+
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    module = import_module(f'{__package__}.{self.module}' if __package__ else self.module)
+                    self._model = getattr(module, self.class_name)(self.version, self.backend)
+
+        return self._model
+
+
+    def get_embeddings(self, string: str, *args: str) -> list:
+        """Get the embeddings of texts, loading the model if needed."""
+
+        return self.model.get_embeddings(string, *args)
+
+    def get_embeddings_batch(self, items: list, batch_size: int = None) -> list:
+        """Get the embeddings of many item texts, loading the model if needed."""
+
+        return self.model.get_embeddings_batch(items, batch_size)
+
+    def warm_up(self) -> None:
+        """Loads the model now rather than on the first request."""
+
+        self.model.warm_up()
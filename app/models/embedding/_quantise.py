@@ -0,0 +1,26 @@
+import numpy as np
+
+# Precisions vectors can be held at. float16 halves the memory of float32, and int8 quarters it.
+precisions = ('float32', 'float16', 'int8')
+
+
+def quantise(vectors: np.ndarray, precision: str = 'float32') -> tuple:
+    """Returns (codes, scales) of a matrix of row vectors, where each row is approximately its codes times its scale.
+
+    int8 codes are scaled per row so that the largest component of each row maps to 127. Float codes have scales of 1."""
+
+    if precision not in precisions: raise ValueError(f'precision must be one of {", ".join(precisions)}')
+
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if precision != 'int8': return np.ascontiguousarray(vectors, dtype=precision), np.ones(len(vectors), dtype=np.float32)
+
+    scales = np.abs(vectors).max(axis=1) / 127
+    scales[scales == 0] = 1
+    codes = np.clip(np.rint(vectors / scales[:, np.newaxis]), -127, 127).astype(np.int8)
+    return codes, scales.astype(np.float32)
+
+
+def dequantise(codes: np.ndarray, scales: np.ndarray) -> np.ndarray:
+    """Returns the float32 row vectors of codes and scales made by quantise."""
+
+    return codes.astype(np.float32) * scales[:, np.newaxis]
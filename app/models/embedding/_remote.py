@@ -0,0 +1,104 @@
+import requests
+if __package__:
+    from ._interface import EmbeddingModelInterface, default_backend
+    from ._lazy import registry
+else:
+    from _interface import EmbeddingModelInterface, default_backend
+    from _lazy import registry
+
+
+class RemoteModel(EmbeddingModelInterface):
+    """Client for a shared embedding server, used in place of a model loaded in this process.
+
+    If the MODEL the server runs is given, the client's key is known without contacting the server, so the app can start
+    before it. The server is checked to be running the same model, version and backend the first time it is used.
+    """
+
+    def __repr__(self) -> str:
+        return self._expected['model'] if self._expected else self.info['model']
+
+    def __init__(self, url: str, timeout: float = 60, name: str = None, version: str = None, backend: str = default_backend) -> None:
+        """Connects to the embedding server at url, e.g. http://127.0.0.1:8765, which is expected to serve the model with
+        MODEL name, version and backend if name is given."""
+
+        if not isinstance(url, str): raise TypeError('url must be a string')
+        if name is not None and name not in registry: raise ValueError(f'model must be one of {", ".join(registry)}')
+
+        self.url = url.rstrip('/')
+        self.timeout = timeout
+        self._info = None
+        self._checked = False
+        self._session = requests.Session()
+
+        self._expected = None
+        if name is not None:
+            _, class_name, default_version = registry[name]
+            self._expected = {'model': class_name, 'version': version or default_version, 'backend': backend}
+
+    @property
+    def info(self) -> dict:
+        """The model name, version, backend and key reported by the server. Fetched on first use."""
+
+        if self._info is None:
+            try:
+                r = self._session.get(f'{self.url}/info', timeout=self.timeout)
+                r.raise_for_status()
+            except requests.RequestException as e:
+                raise ConnectionError(f'The embedding server at EMBEDDING_SERVER={self.url} could not be reached: {e}')
+            self._info = r.json()
+
+        return self._info
+
+    @property
+    def versions(self) -> tuple:
+        return tuple(self.info['versions'])
+
+    @property
+    def version(self) -> str:
+        return self._expected['version'] if self._expected else self.info['version']
+
+    @property
+    def backend(self) -> str:
+        return self._expected['backend'] if self._expected else self.info.get('backend', 'torch')
+
+
+    def get_embeddings(self, string: str, *args: str) -> list:
+        """Get the embeddings of texts from the server, with the same meaning as the model's own get_embeddings."""
+
+        if not isinstance(string, str): raise TypeError('string must be a string')
+        if not all(isinstance(arg, str) for arg in args): raise TypeError('args must be a string')
+
+        return self._post('/embeddings', {'texts': [string] + [arg for arg in args]})
+
+    def get_embeddings_batch(self, items: list, batch_size: int = None) -> list:
+        """Get the embeddings of many item texts from the server, which batches them with other workers' requests."""
+
+        if not isinstance(items, list): raise TypeError('items must be a list')
+        if not all(isinstance(item, str) for item in items): raise TypeError('items must be strings')
+        if len(items) == 0: return []
+
+        return self._post('/batch', {'items': items})
+
+    def warm_up(self) -> None:
+        """Checks that the server is reachable and serves the expected model. The server loads its own model."""
+
+        self.check()
+
+
+    def check(self) -> None:
+        """Raises a ValueError if the server's model is not the one expected. Only contacts the server the first time."""
+
+        if self._checked: return
+
+        info = self.info
+        if self._expected and info['key'] != self.key:
+            raise ValueError(f'The embedding server at EMBEDDING_SERVER={self.url} serves {info["key"]}, but MODEL, MODEL_VERSION and EMBEDDING_BACKEND select {self.key}')
+        self._checked = True
+
+    def _post(self, path: str, body: dict) -> list:
+        """Posts a request to the server and returns its embeddings."""
+
+        self.check()
+        r = self._session.post(f'{self.url}{path}', json=body, timeout=self.timeout)
+        r.raise_for_status()
+        return r.json()['embeddings']
@@ -0,0 +1,68 @@
+# Build-time category embeddings.
+# Embeds the emission factor categories once and writes them to a versioned .npz artifact, so that a new deployment can
+# load the category table without running the model over every category at startup.
+#
+# Usage: MODEL=e5 python app/models/embedding/categories.py [version] [output path]
+
+
+import os, pathlib, ast, sys, zipfile
+import numpy as np
+
+# Increment when the layout of the artifact changes.
+artifact_format = 1
+default_path = pathlib.Path(__file__).parent.parent.parent / 'datasets/category_vectors.npz'
+
+
+def save(path: str, model_key: str, names: list, factors: list, vectors: list) -> None:
+    """Writes category names, factors and vectors to an artifact, tagged with the key of the model that embedded them."""
+
+    if not len(names) == len(factors) == len(vectors): raise ValueError('names, factors and vectors must be the same length')
+
+    np.savez(
+        path,
+        format=np.array(artifact_format),
+        model=np.array(model_key),
+        names=np.array(names, dtype=str),
+        factors=np.array(factors, dtype=np.float64),
+        vectors=np.asarray(vectors, dtype=np.float32)
+    )
+
+
+def load(path: str, model_key: str) -> tuple:
+    """Reads an artifact. Returns (names, factors, vectors), or raises a ValueError if it was built by a different model or
+    format, or is not a complete artifact."""
+
+    try:
+        with np.load(path, allow_pickle=False) as artifact:
+            if int(artifact['format']) != artifact_format: raise ValueError(f'{path} is artifact format {int(artifact["format"])}, expected {artifact_format}')
+            if str(artifact['model']) != model_key: raise ValueError(f'{path} was built by {artifact["model"]}, not {model_key}')
+
+            return artifact['names'].tolist(), artifact['factors'].tolist(), artifact['vectors']
+
+    # A truncated file, or an .npz written by something else.
+    except (KeyError, zipfile.BadZipFile, EOFError) as e:
+        raise ValueError(f'{path} is not a category vectors artifact: {e!r}')
+
+
+def build(model, emission_factors: dict, path: str) -> None:
+    """Embeds every category in batches and saves the artifact."""
+
+    names = list(emission_factors.keys())
+    print(f'Embedding {len(names)} categories with {model.key}...')
+    vectors = model.get_embeddings_batch(names)
+    save(path, model.key, names, [emission_factors[name] for name in names], vectors)
+    print(f'Saved category vectors to {path}')
+
+
+
+if __name__ == '__main__':
+    from _lazy import LazyModel
+
+    model = LazyModel(os.getenv('MODEL'), sys.argv[1] if len(sys.argv) > 1 else os.getenv('MODEL_VERSION'))
+    path = sys.argv[2] if len(sys.argv) > 2 else str(default_path)
+
+    emission_factor_path = pathlib.Path(__file__).parent.parent.parent / 'datasets/item_emission_factors.py'
+    with open(emission_factor_path, 'r') as f:
+        emission_factors = ast.literal_eval(f.read()[19:])
+
+    build(model, emission_factors, path)
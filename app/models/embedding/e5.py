@@ -4,12 +4,15 @@
 # https://huggingface.co/intfloat/e5-large-v2
 
 
+import torch
 from torch import Tensor
 from transformers import AutoTokenizer, AutoModel
-if __name__ == '__main__':
-    from _interface import EmbeddingModelInterface
+if not __package__:
+    from _interface import EmbeddingModelInterface, backends, default_backend
+    from _backend import OnnxEncoder, quantise_dynamic, set_torch_threads
 else:
-    from ._interface import EmbeddingModelInterface
+    from ._interface import EmbeddingModelInterface, backends, default_backend
+    from ._backend import OnnxEncoder, quantise_dynamic, set_torch_threads
 
 
 class E5(EmbeddingModelInterface):
@@ -19,15 +22,22 @@ class E5(EmbeddingModelInterface):
     def __repr__(self) -> str:
         return 'E5'
 
-    def __init__(self, version: str = 'large') -> None:
-        """Initialises the E5 class."""
+    def __init__(self, version: str = 'large', backend: str = default_backend) -> None:
+        """Initialises the E5 class, running inference with the given backend."""
 
         if not isinstance(version, str): raise TypeError('model must be a string')
         if version not in E5.versions: raise ValueError(f'version must be one of {E5.versions}')
+        if backend not in backends: raise ValueError(f'backend must be one of {backends}')
+        self.version = version
+        self.backend = backend
 
         print(f'Loading E5-{version}-v2 model...')
+        set_torch_threads()
         self.tokenizer = AutoTokenizer.from_pretrained(f'intfloat/e5-{version}-v2')
-        self.model = AutoModel.from_pretrained(f'intfloat/e5-{version}-v2')
+        self.model = AutoModel.from_pretrained(f'intfloat/e5-{version}-v2').eval()
+
+        if backend == 'int8': self.model = quantise_dynamic(self.model)
+        if backend == 'onnx': self.model = OnnxEncoder(self.model, self.key)
         print('Loaded model')
     
 
@@ -42,10 +52,14 @@ class E5(EmbeddingModelInterface):
 
         # print('Getting embeddings...')
         batch_dict = self.tokenizer(input_texts, max_length=512, padding=True, truncation=True, return_tensors='pt')
-        outputs = self.model(**batch_dict)
-        last_hidden_states = outputs.last_hidden_state
         attention_mask = batch_dict.attention_mask
 
+        if self.backend == 'onnx':
+            last_hidden_states = self.model(batch_dict.input_ids, attention_mask)
+        else:
+            with torch.inference_mode():
+                last_hidden_states = self.model(**batch_dict).last_hidden_state
+
         return E5.average_pool(last_hidden_states, attention_mask).tolist()
 
 
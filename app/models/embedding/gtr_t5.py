@@ -1,9 +1,11 @@
 from sentence_transformers import SentenceTransformer
 import torch
-if __name__ == '__main__':
-    from _interface import EmbeddingModelInterface
+if not __package__:
+    from _interface import EmbeddingModelInterface, backends, default_backend
+    from _backend import OnnxEncoder, encode_sentence_transformer, quantise_dynamic, set_torch_threads
 else:
-    from ._interface import EmbeddingModelInterface
+    from ._interface import EmbeddingModelInterface, backends, default_backend
+    from ._backend import OnnxEncoder, encode_sentence_transformer, quantise_dynamic, set_torch_threads
 
 
 class GTR_T5(EmbeddingModelInterface):
@@ -13,14 +15,24 @@ class GTR_T5(EmbeddingModelInterface):
     def __repr__(self) -> str:
         return 'GTR_T5'
     
-    def __init__(self, version: str = 'xxl') -> None:
-        """Initialise the GTR T5 class."""
+    def __init__(self, version: str = 'xxl', backend: str = default_backend) -> None:
+        """Initialise the GTR T5 class, running inference with the given backend."""
 
         if not isinstance(version, str): raise TypeError('version must be a string')
         if version not in self.versions: raise ValueError(f'version must be one of {self.versions}')
+        if backend not in backends: raise ValueError(f'backend must be one of {backends}')
+        self.version = version
+        self.backend = backend
 
         print('Initialising GTR T5...')
-        self.model = SentenceTransformer(f'sentence-transformers/gtr-t5-{version}')
+        set_torch_threads()
+        self.model = SentenceTransformer(f'sentence-transformers/gtr-t5-{version}', device='cpu' if backend != 'torch' else None)
+
+        # The onnx backend only replaces the transformer, the first of the model's modules, whose tokenizer is still used.
+        if backend == 'int8': self.model = quantise_dynamic(self.model)
+        if backend == 'onnx':
+            self.encoder = OnnxEncoder(self.model[0].auto_model, self.key)
+            self.model[0].auto_model = None
         print('Loaded model')
 
 
@@ -31,7 +43,11 @@ class GTR_T5(EmbeddingModelInterface):
         if not all(isinstance(arg, str) for arg in args): raise TypeError('args must be a string')
 
         # print('Getting embeddings...')
-        return self.model.encode([string] + [arg for arg in args]).tolist()
+        texts = [string] + [arg for arg in args]
+        if self.backend == 'onnx': return encode_sentence_transformer(self.model, self.encoder, texts)
+
+        with torch.inference_mode():
+            return self.model.encode(texts).tolist()
 
         
 
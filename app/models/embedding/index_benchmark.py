@@ -0,0 +1,66 @@
+# Category index benchmark.
+# Compares the approximate ivf index with the exact index on recall@1 (the fraction of queries matched to the same
+# category) and query time, for a range of probes. Uses the prebuilt category vectors if given, else clustered random
+# vectors, with queries made by adding noise to random categories.
+#
+# Usage: python app/models/embedding/index_benchmark.py [categories or category vectors .npz] [queries] [lists]
+
+
+import sys, time
+import numpy as np
+if not __package__:
+    from _index import CategoryIndex, IVFIndex
+else:
+    from ._index import CategoryIndex, IVFIndex
+
+
+def synthetic_categories(count: int, dimensions: int = 768, clusters: int = 200, seed: int = 0) -> np.ndarray:
+    """Returns count random vectors spread around clusters random centres, like the embeddings of related products."""
+
+    rng = np.random.default_rng(seed)
+    centres = rng.standard_normal((clusters, dimensions))
+    return (centres[rng.integers(clusters, size=count)] + 0.6 * rng.standard_normal((count, dimensions))).astype(np.float32)
+
+
+def benchmark(vectors: np.ndarray, query_count: int = 1000, lists: int = 0, probes: tuple = (1, 2, 4, 8, 16, 32), noise: float = 3.0, seed: int = 1) -> None:
+    """Prints the build time, and the recall@1 and query time of each number of probes against the exact index."""
+
+    rng = np.random.default_rng(seed)
+    names = [str(i) for i in range(len(vectors))]
+    factors = [0] * len(vectors)
+
+    targets = vectors[rng.integers(len(vectors), size=query_count)]
+    queries = targets + noise * np.linalg.norm(targets, axis=1, keepdims=True) / np.sqrt(vectors.shape[1]) * rng.standard_normal(targets.shape)
+
+    exact = CategoryIndex(names, factors, vectors)
+    start = time.perf_counter()
+    expected = [name for name, _, _ in exact.search_batch(queries)]
+    exact_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    ivf = IVFIndex(names, factors, vectors, lists)
+    print(f'{len(vectors)} categories, {vectors.shape[1]} dimensions, {len(ivf.centroids)} lists, built in {time.perf_counter() - start:.2f}s')
+    print(f'exact: {1000 * exact_time / query_count:.3f} ms/query')
+
+    for probe in probes:
+        ivf.probes = probe
+        start = time.perf_counter()
+        found = [name for name, _, _ in ivf.search_batch(queries)]
+        elapsed = time.perf_counter() - start
+
+        recall = sum(a == b for a, b in zip(found, expected)) / query_count
+        print(f'ivf, {probe} probes: recall@1 {recall:.3f}, {1000 * elapsed / query_count:.3f} ms/query')
+
+
+
+if __name__ == '__main__':
+    source = sys.argv[1] if len(sys.argv) > 1 else '20000'
+    query_count = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    lists = int(sys.argv[3]) if len(sys.argv) > 3 else 0
+
+    if source.endswith('.npz'):
+        with np.load(source, allow_pickle=False) as artifact: vectors = artifact['vectors']
+    else:
+        vectors = synthetic_categories(int(source))
+
+    benchmark(vectors, query_count, lists)
@@ -1,9 +1,11 @@
 from InstructorEmbedding import INSTRUCTOR
 import torch
-if __name__ == '__main__':
-    from _interface import EmbeddingModelInterface
+if not __package__:
+    from _interface import EmbeddingModelInterface, default_batch_size, default_backend
+    from _backend import quantise_dynamic, set_torch_threads
 else:
-    from ._interface import EmbeddingModelInterface
+    from ._interface import EmbeddingModelInterface, default_batch_size, default_backend
+    from ._backend import quantise_dynamic, set_torch_threads
 
 
 class Instructor(EmbeddingModelInterface):
@@ -13,14 +15,21 @@ class Instructor(EmbeddingModelInterface):
     def __repr__(self) -> str:
         return 'Instructor'
     
-    def __init__(self, version: str = 'xl'):
-        """Initialise the Instructor model."""
+    def __init__(self, version: str = 'xl', backend: str = default_backend):
+        """Initialise the Instructor model, running inference with the given backend. Instructor pools over the text without
+        its instruction inside its own modules, so it has no onnx backend."""
 
         if not isinstance(version, str): raise TypeError('version must be a string')
         if version not in Instructor.versions: raise ValueError(f'version must be one of {Instructor.versions}')
+        if backend not in ('torch', 'int8'): raise ValueError('backend must be torch or int8 for Instructor')
+        self.version = version
+        self.backend = backend
 
         print(f'Loading Instructor-{version}...')
-        self.model = INSTRUCTOR(f'hkunlp/instructor-{version}')
+        set_torch_threads()
+        self.model = INSTRUCTOR(f'hkunlp/instructor-{version}', device='cpu' if backend != 'torch' else None)
+
+        if backend == 'int8': self.model = quantise_dynamic(self.model)
         print('Loaded model')
     
 
@@ -35,7 +44,20 @@ class Instructor(EmbeddingModelInterface):
         all_inputs = item_input + category_inputs
 
         # print('Getting embeddings...')
-        return self.model.encode(all_inputs).tolist()
+        with torch.inference_mode():
+            return self.model.encode(all_inputs).tolist()
+
+
+    def get_embeddings_batch(self, items: list, batch_size: int = None) -> list:
+        """Get the embeddings of many item texts. Every text is given the item instruction, unlike the trailing arguments of get_embeddings."""
+
+        if not isinstance(items, list): raise TypeError('items must be a list')
+        if not all(isinstance(item, str) for item in items): raise TypeError('items must be strings')
+        if len(items) == 0: return []
+
+        item_inputs = [f'Represent the Food item: {item}' for item in items]
+        with torch.inference_mode():
+            return self.model.encode(item_inputs, batch_size=batch_size or default_batch_size).tolist()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,148 @@
+# Shared embedding server.
+# Holds a single copy of the selected model for every worker process, and batches item embedding requests from concurrent
+# workers into shared forward passes. Workers connect to it by setting EMBEDDING_SERVER to its address.
+#
+# Usage: MODEL=e5 python app/models/embedding/server.py [host] [port]
+
+
+import os, sys, json, queue, threading, time
+from concurrent.futures import Future
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+if not __package__:
+    from _interface import EmbeddingModelInterface, default_batch_size, inference_concurrency
+else:
+    from ._interface import EmbeddingModelInterface, default_batch_size, inference_concurrency
+
+
+class MicroBatcher:
+    """Collects item embedding requests from many threads and embeds them together.
+
+    The first waiting request opens a batch, which is run once it holds max_batch texts or max_wait seconds have passed.
+    Identical texts within a batch are embedded once and shared between the requests that asked for them. If a batch fails,
+    its requests are retried one at a time, so that only those that fail on their own are failed.
+    """
+
+    def __init__(self, model: EmbeddingModelInterface, max_batch: int = default_batch_size, max_wait: float = 0.005) -> None:
+        """Starts the batching thread for a model."""
+
+        if not isinstance(model, EmbeddingModelInterface): raise TypeError('model must implement EmbeddingModelInterface')
+        if max_batch < 1: raise ValueError('max_batch must be at least 1')
+
+        self.model = model
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.batches = 0
+        self.texts = 0
+
+        self._queue = queue.Queue()
+        threading.Thread(target=self._run, daemon=True).start()
+
+    def embed(self, items: list) -> list:
+        """Queues item texts for embedding and blocks until their batch has run."""
+
+        future = Future()
+        self._queue.put((items, future))
+        return future.result()
+
+    def _run(self) -> None:
+        """Forms and runs batches until the process exits."""
+
+        while True:
+            pending = [self._queue.get()]
+            size = len(pending[0][0])
+            deadline = time.monotonic() + self.max_wait
+
+            while size < self.max_batch:
+                try: pending.append(self._queue.get(timeout=max(deadline - time.monotonic(), 0)))
+                except queue.Empty: break
+                size += len(pending[-1][0])
+
+            try:
+                self._embed(pending)
+            except Exception:
+                for request in pending:
+                    try: self._embed([request])
+                    except Exception as e: request[1].set_exception(e)
+
+    def _embed(self, pending: list) -> None:
+        """Embeds the texts of (items, future) requests in one batch, and sets each future's result."""
+
+        texts = list(dict.fromkeys(text for items, _ in pending for text in items))
+        embeddings = dict(zip(texts, self.model.get_embeddings_batch(texts, self.max_batch)))
+
+        self.batches += 1
+        self.texts += len(texts)
+        for items, future in pending: future.set_result([embeddings[text] for text in items])
+
+
+def make_handler(model: EmbeddingModelInterface, batcher: MicroBatcher) -> type:
+    """Returns a request handler class serving a model and its batcher."""
+
+    class EmbeddingRequestHandler(BaseHTTPRequestHandler):
+        """Serves GET /info, POST /batch with {"items": [...]} and POST /embeddings with {"texts": [...]}."""
+
+        def do_GET(self) -> None:
+            if self.path == '/info':
+                self._respond(200, {'model': repr(model), 'version': model.version, 'backend': model.backend, 'key': model.key, 'versions': list(model.versions), 'batches': batcher.batches, 'texts': batcher.texts})
+            else:
+                self._respond(404, {'error': 'not found'})
+
+        def do_POST(self) -> None:
+            try:
+                body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))))
+                if self.path == '/batch':
+                    # Check a request before it joins a batch, where it would fail the requests it shares it with.
+                    items = body['items']
+                    if not isinstance(items, list): raise TypeError('items must be a list')
+                    if not all(isinstance(item, str) for item in items): raise TypeError('items must be strings')
+                    self._respond(200, {'embeddings': batcher.embed(items)})
+                elif self.path == '/embeddings':
+                    texts = body['texts']
+                    if not isinstance(texts, list) or len(texts) == 0: raise TypeError('texts must be a non-empty list')
+                    self._respond(200, {'embeddings': model.get_embeddings(*texts)})
+                else:
+                    self._respond(404, {'error': 'not found'})
+            except (KeyError, TypeError, ValueError) as e:
+                self._respond(400, {'error': str(e)})
+            except Exception as e:
+                self._respond(500, {'error': repr(e)})
+
+        def _respond(self, status: int, body: dict) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, format: str, *args) -> None:
+            pass
+
+    return EmbeddingRequestHandler
+
+
+def serve(model: EmbeddingModelInterface, host: str = '127.0.0.1', port: int = 8765) -> None:
+    """Loads the model and serves it until interrupted."""
+
+    model.warm_up()
+    batcher = MicroBatcher(
+        model,
+        max_batch=int(os.getenv('EMBEDDING_SERVER_MAX_BATCH', default_batch_size)),
+        max_wait=int(os.getenv('EMBEDDING_SERVER_MAX_WAIT_MS', 5)) / 1000
+    )
+    server = ThreadingHTTPServer((host, port), make_handler(model, batcher))
+    print(f'Serving {model.key} embeddings on http://{host}:{port}')
+    server.serve_forever()
+
+
+
+if __name__ == '__main__':
+    from _lazy import LazyModel
+    from _executor import InferenceExecutor
+
+    # Batches and /embeddings requests queue for the model together.
+    model = InferenceExecutor(LazyModel(os.getenv('MODEL'), os.getenv('MODEL_VERSION')), inference_concurrency)
+    host = sys.argv[1] if len(sys.argv) > 1 else '127.0.0.1'
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else 8765
+
+    serve(model, host, port)
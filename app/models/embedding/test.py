@@ -1,6 +1,27 @@
-import pathlib, csv, ast, json
+import pathlib, csv, ast, json, os
 from colorama import Fore
 import random
+import numpy as np
+from _index import CategoryIndex
+from _quantise import quantise, dequantise
+
+def parity(model, reference, items: list, categories: list) -> float:
+    """Compares a model's embeddings with a reference's, such as the same model run by another backend. Prints the cosine
+    similarity of their embeddings and how often they match items to the same category, and returns the lowest similarity."""
+
+    embeddings = CategoryIndex.normalise(np.array(model.get_embeddings_batch(items + categories)))
+    reference_embeddings = CategoryIndex.normalise(np.array(reference.get_embeddings_batch(items + categories)))
+    similarities = (embeddings * reference_embeddings).sum(axis=1)
+
+    index = CategoryIndex(categories, [0] * len(categories), embeddings[len(items):])
+    reference_index = CategoryIndex(categories, [0] * len(categories), reference_embeddings[len(items):])
+    matches = [match[0] for match in index.search_batch(embeddings[:len(items)])]
+    reference_matches = [match[0] for match in reference_index.search_batch(reference_embeddings[:len(items)])]
+
+    print(f'Embedding similarity: mean {similarities.mean():.5f}, min {similarities.min():.5f}')
+    print(f'Same category:        {sum(a == b for a, b in zip(matches, reference_matches))}/{len(items)}')
+    return float(similarities.min())
+
 
 def test(model):
 
@@ -12,9 +33,25 @@ def test(model):
     with open(emission_factor_path, 'r') as f:
         emission_factors = ast.literal_eval(f.read()[19:]) 
 
+    # Check a faster backend against the PyTorch embeddings before testing it.
+    if model.backend != 'torch':
+        print(f'Comparing {model.backend} backend with torch...')
+        with open(pathlib.Path(__file__).parent.parent.parent / 'datasets/omnivore.csv', 'r') as f:
+            items = [line[3] for line in list(csv.reader(f))[1:] if all(line) and len(line) == 6]
+        parity(model, type(model)(model.version, 'torch'), items, list(emission_factors.keys()))
+
     emission_factor_vectors = {emission_factor: model.get_embeddings(emission_factor)[0] for emission_factor in emission_factors.keys()}
     category_emission_factor = 0.51748
 
+    # Match items as the app would with the configured precisions, alongside full precision matches to compare them to.
+    index_precision = os.getenv('VECTOR_INDEX_PRECISION', 'float32')
+    cache_precision = os.getenv('EMBEDDING_CACHE_PRECISION', 'float32')
+    index = CategoryIndex(
+        list(emission_factor_vectors.keys()), [0] * len(emission_factor_vectors), list(emission_factor_vectors.values()),
+        index_precision, int(os.getenv('VECTOR_INDEX_RESCORE', 16)), lambda names: [emission_factor_vectors[name] for name in names]
+    )
+    print(f'Index precision {index_precision}, cache precision {cache_precision}')
+
     for diet in ['omnivore', 'vegetarian-replace', 'vegetarian-remove', 'vegan-replace', 'vegan-remove']:
     # for diet in ['omnivore']:
         print(diet.upper())
@@ -22,6 +59,7 @@ def test(model):
         print('Starting embedding test...')
         results = []
         total_correct = 0
+        total_agreed = 0
 
         correct_items = []
         incorrect_items = []
@@ -47,7 +85,9 @@ def test(model):
                 if all(line) and len(line) == 6:
                     # Get the item embedding and find the best match
                     item_embedding = model.get_embeddings(line[3])[0]
-                    best_match = model.get_item_from_vectors(item_embedding, *emission_factor_vectors.items())
+                    full_precision_match = model.get_item_from_vectors(item_embedding, *emission_factor_vectors.items())
+                    best_match = index.search(dequantise(*quantise([item_embedding], cache_precision))[0])
+                    total_agreed += best_match[0] == full_precision_match[0]
 
                     # Check if the best match is correct
                     correct = best_match[0] == line[5]
@@ -206,6 +246,7 @@ def test(model):
         # print(f'Macro-avg prec.:    {round(macro_average_precision, 2)}')
         # print(f'Macro-avg recall:   {round(macro_average_recall, 2)}')
         print(f'Macro-avg F1:       {round(macro_average_f1, 2)}')
+        print(f'Same as float32:    {total_agreed}/{len(results)}')
         print('\nEnd of test.\n\n')
 
         # print('\n~~~User-Merchant History~~~')
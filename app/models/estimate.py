@@ -1,10 +1,19 @@
 from .. import db
-from sqlalchemy import Column, ForeignKey, String, Integer, DateTime, PickleType, desc
+from sqlalchemy import Column, ForeignKey, String, Integer, Float, DateTime, Index, desc, event
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from uuid import uuid4
-from .transaction import Transaction, Merchant
+from datetime import datetime
+from .transaction import Transaction, Merchant, Receipt
+from .aggregate import MerchantTotal
+from .vector import Vector
 from ..models.embedding import model as Embedder
-import os
+from ..models.embedding._index import VectorIndex, build_index
+from ..models.embedding._interface import normalise_text
+import os, threading
+import numpy as np
 from ast import literal_eval
+from itertools import chain
 
 
 active_methods = []
@@ -12,17 +21,122 @@ if literal_eval(os.getenv('ESTIMATE_BY_ITEM', False)): active_methods.append('it
 if literal_eval(os.getenv('ESTIMATE_BY_MERCHANT', False)): active_methods.append('merchant')
 if literal_eval(os.getenv('ESTIMATE_BY_MCC', True)): active_methods.append('mcc')
 
+# Precision of the stored category vectors, float32 or float16.
+category_vector_dtype = os.getenv('CATEGORY_VECTOR_DTYPE', 'float32')
+
+# Category index backend: exact, or ivf to search large category tables approximately. An ivf index is saved to disk.
+vector_index = os.getenv('VECTOR_INDEX', 'exact')
+if vector_index not in ('exact', 'ivf'): raise ValueError('VECTOR_INDEX must be exact or ivf')
+vector_index_path = os.getenv('VECTOR_INDEX_PATH', os.path.join(os.path.dirname(os.path.dirname(__file__)), '.category_index.npz'))
+ivf_lists = int(os.getenv('IVF_LISTS', 0))
+ivf_probes = int(os.getenv('IVF_PROBES', 8))
+
+# Precision the category index holds vectors at: float32, float16 or int8. A quantised index rescores its best
+# VECTOR_INDEX_RESCORE candidates for each item with their stored vectors.
+vector_index_precision = os.getenv('VECTOR_INDEX_PRECISION', 'float32')
+vector_index_rescore = int(os.getenv('VECTOR_INDEX_RESCORE', 16))
+
+# Items matched less closely than this are estimated by their price with the merchant or MCC method instead.
+item_min_similarity = float(os.getenv('ITEM_MIN_SIMILARITY', '-inf'))
+
+# Above 1, an item's factor is the similarity-weighted mean of the factors of this many of its closest categories.
+item_match_top_k = int(os.getenv('ITEM_MATCH_TOP_K', 1))
+if item_match_top_k < 1: raise ValueError('ITEM_MATCH_TOP_K must be at least 1')
+
+
+class EstimateError(Exception):
+    """Raised when a transaction can't be estimated from the data held for it, so estimating it again won't help."""
+
 
 class GroceryItem(db.Model):
     __tablename__ = 'category'
 
     name = Column(String, primary_key=True)
     factor = Column(Integer, nullable=False)
-    vector = Column(PickleType, nullable=False)
+    vector = Column(Vector(category_vector_dtype), nullable=False)
+
+    # Key of the embedding model that made the vector, recorded by migrate for categories stored before it was kept.
+    # Categories embedded by another model are re-embedded at startup.
+    model = Column(String, nullable=True)
+
+    _index = None
+    _index_stale = True
+    _index_lock = threading.Lock()
+
+    @staticmethod
+    def embedded_by_other_models(model_key: str) -> bool:
+        """Returns True if any category was recorded as embedded by a model other than model_key."""
+
+        return GroceryItem.query.filter(GroceryItem.model != model_key).first() is not None
+
+    @staticmethod
+    def get_index() -> VectorIndex:
+        """Returns the process-wide category index, reloading it from the category table if the table has changed."""
+
+        with GroceryItem._index_lock:
+            if GroceryItem._index is None or GroceryItem._index_stale or len(GroceryItem._index) != GroceryItem.query.count():
+                categories = GroceryItem.query.all()
+                GroceryItem._index = build_index(
+                    vector_index,
+                    [category.name for category in categories],
+                    [category.factor for category in categories],
+                    [category.vector for category in categories],
+                    vector_index_path, ivf_lists, ivf_probes,
+                    vector_index_precision, vector_index_rescore, GroceryItem.get_vectors
+                )
+                GroceryItem._index_stale = False
+            return GroceryItem._index
+
+    @staticmethod
+    def get_vectors(names: list) -> list:
+        """Returns the stored vectors of the named categories, in the order given."""
+
+        vectors = {}
+        for start in range(0, len(names), 500):
+            vectors.update(db.session.query(GroceryItem.name, GroceryItem.vector).filter(GroceryItem.name.in_(names[start:start + 500])))
+        return [vectors[name] for name in names]
+
+
+class ResolvedItem(db.Model):
+    """Memo of the category a normalised receipt item text was matched to, so repeat items skip embedding and search."""
+    __tablename__ = 'resolved_item'
+
+    text = Column(String, primary_key=True)
+    model = Column(String, nullable=False)
+    category = Column(String, nullable=False)
+    similarity = Column(Float, nullable=False)
+    factor = Column(Float, nullable=False)
+
+    @staticmethod
+    def key() -> str:
+        """Returns the key of the current model and match settings, which entries are resolved under."""
+
+        return Embedder.key if item_match_top_k == 1 else f'{Embedder.key}-top{item_match_top_k}'
+
+    @staticmethod
+    def drop_other_models(model_key: str) -> int:
+        """Deletes entries resolved by any model other than model_key. Returns the number deleted."""
+
+        return ResolvedItem.query.filter(ResolvedItem.model != model_key).delete()
+
+
+@event.listens_for(Session, 'after_flush')
+def invalidate_category_index(session, flush_context):
+    """Marks the category index as stale and drops resolved items whenever a flush writes to the category table."""
+
+    if any(isinstance(obj, GroceryItem) for obj in chain(session.new, session.dirty, session.deleted)):
+        GroceryItem._index_stale = True
+        session.connection().execute(ResolvedItem.__table__.delete())
+
+
+# Default of Estimate's existing_estimate, for when the caller has not looked it up.
+_not_looked_up = object()
+
 
 class Estimate(db.Model):
     """Estimate model for calculating the CO2e of a transaction."""
     __tablename__ = 'estimate'
+    __table_args__ = (Index('ix_estimate_transaction_id_datetime', 'transaction_id', 'datetime'),)
 
     _transaction = None
     _existing_estimate = False
@@ -34,15 +148,17 @@ class Estimate(db.Model):
     datetime = Column(DateTime, nullable=False, default=db.func.now())
 
     
-    def __init__(self, transaction: Transaction) -> None:
-        """Initialises the Estimate object with a Transaction object."""
+    def __init__(self, transaction: Transaction, existing_estimate: 'Estimate' = _not_looked_up) -> None:
+        """Initialises the Estimate object with a Transaction object, starting from its latest existing estimate. That is
+        looked up here unless the caller passes it in (or None), so that a batch of transactions can look theirs up in one query."""
 
         if not isinstance(transaction, Transaction): raise TypeError('Estimate input must be a Transaction')
         self._transaction = transaction
         self.id = str(uuid4())
         self.transaction_id = transaction.id
 
-        existing_estimate = Estimate.query.filter_by(transaction_id=transaction.id).order_by(desc('datetime')).first()
+        if existing_estimate is _not_looked_up:
+            existing_estimate = Estimate.query.filter_by(transaction_id=transaction.id).order_by(desc('datetime')).first()
         if existing_estimate:
             self._existing_estimate = True
             self.method = existing_estimate.method
@@ -58,79 +174,153 @@ class Estimate(db.Model):
 
     def generate_estimate(self) -> dict:
         """Calculates the CO2e of the transaction. Returns a dictionary of the CO2e and the method used to calculate it."""
+
+        receipt = self._transaction.receipt.first()
+        merchant = Merchant.query.get(self._transaction.merchant_id) if self._transaction.merchant_id else None
+
+        self.calculate(receipt.items if receipt else None, merchant, lambda key: MerchantTotal.get_totals(key)[key])
+
+        if self.method and self.co2e:
+            self.save()
+            db.session.commit()
+        else:
+            return 'Could not produce an estimate.'
+
+        return {'method': self.method, 'co2e': self.co2e}
+
+
+    @staticmethod
+    def generate_many(transactions: list, refresh: bool = False) -> dict:
+        """Estimates many transactions, sharing lookups between them, and writes every estimate in one commit.
+
+        Returns a dictionary of transaction id: result, where result is as returned by generate_estimate, or the error for a
+        transaction that could not be estimated. If refresh is True, existing estimates are ignored and every transaction is
+        estimated from scratch.
+        """
+
+        if not all(isinstance(transaction, Transaction) for transaction in transactions): raise TypeError('transactions must be Transactions')
+
+        transaction_ids = [transaction.id for transaction in transactions]
+
+        existing_estimates = {}
+        if not refresh:
+            for estimate in Estimate.query.filter(Estimate.transaction_id.in_(transaction_ids)).order_by(desc('datetime')):
+                existing_estimates.setdefault(estimate.transaction_id, estimate)
+
+        receipts = {
+            receipt.transaction_id: receipt.items
+            for receipt in Receipt.query.options(selectinload(Receipt.items)).filter(Receipt.transaction_id.in_(transaction_ids))
+        }
+        merchant_ids = {transaction.merchant_id for transaction in transactions if transaction.merchant_id}
+        merchants = {merchant.id: merchant for merchant in Merchant.query.filter(Merchant.id.in_(merchant_ids))}
+        now = datetime.utcnow()
+        merchant_totals = MerchantTotal.get_totals(*{MerchantTotal.key(transaction) for transaction in transactions if transaction.merchant_id}, at=now)
+
+        # Match the weighted items of every receipt in one batch.
+        matches = {}
+        if 'item' in active_methods:
+            matches = Estimate.match_items([item.name for items in receipts.values() for item in items if item.weight_kg is not None])
+
+        results = {}
+        for transaction in transactions:
+            estimate = Estimate(transaction, existing_estimates.get(transaction.id))
+            previous_co2e = transaction.co2e
+
+            # Calculate within a savepoint, so that items matched before a failure aren't written with the other estimates.
+            savepoint = db.session.begin_nested()
+            try:
+                estimate.calculate(receipts.get(transaction.id), merchants.get(transaction.merchant_id), merchant_totals.get, matches)
+            except Exception as e:
+                savepoint.rollback()
+                results[transaction.id] = str(e)
+                continue
+
+            if estimate.method and estimate.co2e:
+                estimate.save()
+                savepoint.commit()
+                results[transaction.id] = estimate.get_estimate()
+
+                # Keep merchant totals as they would be had each estimate been committed in turn.
+                key = MerchantTotal.key(transaction)
+                if key in merchant_totals and transaction.amount_pence:
+                    weight = MerchantTotal.weight(transaction, now)
+                    total_co2e, total_amount_pence = merchant_totals[key]
+                    if previous_co2e:
+                        total_co2e -= weight * previous_co2e
+                        total_amount_pence -= weight * transaction.amount_pence
+                    merchant_totals[key] = (total_co2e + weight * estimate.co2e, total_amount_pence + weight * transaction.amount_pence)
+            else:
+                savepoint.rollback()
+                results[transaction.id] = 'Could not produce an estimate.'
+
+        db.session.commit()
+        return results
+
+
+    def calculate(self, items: list, merchant: Merchant, merchant_totals: callable, matches: dict = None) -> None:
+        """Calculates the CO2e of the transaction from its ReceiptItems (or None), its merchant (or None), a function returning
+        the (total CO2e, total amount in pence) of a MerchantTotal key, and optionally precomputed item matches. Sets method and
+        co2e, and the matched category and CO2e of each item estimated."""
         item_emissions = {}
-        no_weight_items = {}
+        price_items = []
 
         # Prioritise receipts as they have the most detailed data.
-        if self._transaction.receipt.first():
-
-            items = self._transaction.receipt.first().items
+        if items is not None:
 
             # Look up item specific CO2e.
             if 'item' in active_methods:
                 self.method = 'item'
-                categories = GroceryItem.query.all()
-                category_tuples = [(category.name, category.vector) for category in categories]
                 
-                # Put items with no weight provided into a separate dict.
-                for item in list(items.items()):
-                    weightprice = literal_eval(item[1])
-                    if weightprice[0] == None:
-                        no_weight_items[item[0]] = items.pop(item[0])
+                # Put items with no weight provided into a separate list.
+                price_items = [item for item in items if item.weight_kg is None]
+                items = [item for item in items if item.weight_kg is not None]
+
+                # Esitmate the CO2e of items with weight provided, leaving those without a close enough match to be estimated by price.
+                if matches is None: matches = Estimate.match_items([item.name for item in items])
+                for item in items:
 
-                # Esitmate the CO2e of items with weight provided.
-                for item, weightprice in items.items():
+                    best_match, similarity, factor = matches[item.name]
+                    item.matched_category, item.similarity = best_match, similarity
 
-                    weight, price = literal_eval(weightprice)
-                    
-                    item_embedding = Embedder.get_embeddings(item)[0]
-                    best_match = Embedder.get_item_from_vectors(item_embedding, *category_tuples)
+                    if similarity < item_min_similarity:
+                        price_items.append(item)
+                        continue
 
-                    item_emissions[item] = weight * float(GroceryItem.query.get(best_match[0]).factor)
+                    item.co2e = item_emissions[item] = item.weight_kg * factor
 
                 self.co2e = sum(item_emissions.values())
 
-        # Use previous estimates and merchant category to estimate the transaction, or remaining items with no weight provided.
-        if Merchant.query.get(self._transaction.merchant_id) and (not self.method or len(no_weight_items) != 0):
+        # Use previous estimates and merchant category to estimate the transaction, or remaining items by their price.
+        if merchant and (not self.method or len(price_items) != 0):
             
             # First, try to base an estimate on previous user transactions with this merchant.
             try:
                 if 'merchant' in active_methods:
-                    if len(no_weight_items) > 0: self.method = 'item/merchant'
+                    if len(price_items) > 0: self.method = 'item/merchant'
                     else: self.method = 'merchant'
-                    merchant_transactions = Transaction.query.filter_by(merchant_id=self._transaction.merchant_id).all()
-                    if merchant_transactions:
 
-                        total_co2e = 0
-                        total_amount_pence = 0
+                    total_co2e, total_amount_pence = merchant_totals(MerchantTotal.key(self._transaction))
+                    if not total_amount_pence: raise EstimateError('No previous transactions with this merchant.')
 
-                        for transaction in merchant_transactions:
-                            if transaction.co2e and transaction.amount_pence:
-                                total_co2e += transaction.co2e
-                                total_amount_pence += transaction.amount_pence
-                        
-                        if total_amount_pence == 0: raise Exception('No previous transactions with this merchant.')
+                    merchant_emission_factor =  total_co2e / total_amount_pence
 
-                        merchant_emission_factor =  total_co2e / total_amount_pence
-
-                        if len(no_weight_items) > 0:
-                            for item, weightprice in no_weight_items.items():
-                                price = literal_eval(weightprice)[1]
-                                item_emissions[item] = price * merchant_emission_factor
-                                self.co2e = sum(item_emissions.values())
+                    if len(price_items) > 0:
+                        for item in price_items:
+                            item.co2e = item_emissions[item] = item.price_pence * merchant_emission_factor
+                            self.co2e = sum(item_emissions.values())
 
-                        else:
-                            self.co2e = merchant_emission_factor * self._transaction.amount_pence
-                else: raise Exception('Merchant method inactive.')
+                    else:
+                        self.co2e = merchant_emission_factor * self._transaction.amount_pence
+                else: raise EstimateError('Merchant method inactive.')
 
             # If that fails, base an estimate on the merchant's MCC.
             except:
                 if 'mcc' in active_methods:
 
-                    if len(no_weight_items) > 0: self.method = 'item/mcc'
+                    if len(price_items) > 0: self.method = 'item/mcc'
                     else: self.method = 'mcc'
 
-                    mcc = Merchant.query.get(self._transaction.merchant_id).mcc
+                    mcc = merchant.mcc
 
                     match mcc:
                         case 5411:
@@ -152,29 +342,71 @@ class Estimate(db.Model):
                             # Convenience stores and speciality markets
                             MCC_emission_factor = 0.518
                         case _:
-                            raise Exception('MCC does not sell groceries.')
+                            raise EstimateError('MCC does not sell groceries.')
 
                     if mcc >= 5411 and mcc <= 5499:
 
-                        if len(no_weight_items) != 0:
-                            for item, weightprice in no_weight_items.items():
-                                price = literal_eval(weightprice)[1]
-                                item_emissions[item] = price * MCC_emission_factor
+                        if len(price_items) != 0:
+                            for item in price_items:
+                                item.co2e = item_emissions[item] = item.price_pence * MCC_emission_factor
                                 self.co2e = sum(item_emissions.values())
                         else:
                             self.co2e = MCC_emission_factor * (self._transaction.amount_pence / 100)
-        
-        if self.method and self.co2e:
-            self.co2e = round(self.co2e, 5)
-            db.session.add(self)
-            transaction = Transaction.query.get(self.transaction_id)
-            transaction.co2e = self.co2e
-            db.session.commit()
-        else:
-            return 'Could not produce an estimate.'
 
-        return {'method': self.method, 'co2e': self.co2e}
-    
+
+    def save(self) -> None:
+        """Rounds the CO2e and adds the estimate to the session, updating the transaction's CO2e. Does not commit."""
+
+        self.co2e = round(self.co2e, 5)
+        db.session.add(self)
+        self._transaction.co2e = self.co2e
+
+
+    @staticmethod
+    def match_items(items: list) -> dict:
+        """Matches item names, from one or more receipts, to their most similar category. Returns a dictionary of item: (category, cosine similarity, factor).
+
+        With ITEM_MATCH_TOP_K above 1, the factor is a blend of the closest categories' factors. Items resolved before are read from the resolved item memo. The rest are embedded together in padded batches of up to
+        EMBEDDING_BATCH_SIZE rather than one forward pass per item, and added to the memo."""
+
+        if not isinstance(items, list): raise TypeError('items must be a list')
+
+        texts = {item: normalise_text(item) for item in items}
+        unique_texts = list(dict.fromkeys(texts.values()))
+        if len(unique_texts) == 0: return {}
+
+        resolved = {}
+        for resolved_item in ResolvedItem.query.filter(ResolvedItem.model == ResolvedItem.key(), ResolvedItem.text.in_(unique_texts)):
+            resolved[resolved_item.text] = (resolved_item.category, resolved_item.similarity, resolved_item.factor)
+
+        missing = [text for text in unique_texts if text not in resolved]
+        if missing:
+            embeddings = Embedder.get_embeddings_batch(missing)
+            names, scores, factors = GroceryItem.get_index().search_top_k(embeddings, item_match_top_k)
+
+            rows = []
+            for text, text_names, text_scores, text_factors in zip(missing, names, scores, factors):
+                match = (text_names[0], float(text_scores[0]), Estimate.blend(text_scores, text_factors))
+                resolved[text] = match
+                rows.append({'text': text, 'model': ResolvedItem.key(), 'category': match[0], 'similarity': match[1], 'factor': match[2]})
+
+            # Upsert, as another worker may have resolved the same text in the meantime.
+            upsert = sqlite_insert(ResolvedItem).values(rows)
+            db.session.execute(upsert.on_conflict_do_update(index_elements=['text'], set_={column: upsert.excluded[column] for column in ('model', 'category', 'similarity', 'factor')}))
+
+        return {item: resolved[text] for item, text in texts.items()}
+
+
+    @staticmethod
+    def blend(scores: list, factors: list) -> float:
+        """Returns the mean of the factors of an item's closest categories weighted by their positive similarities, or the
+        closest category's factor if there is only one or none are positive."""
+
+        weights = np.clip(np.asarray(scores, dtype=np.float64), 0, None)
+        if len(weights) == 1 or weights.sum() == 0: return float(factors[0])
+
+        return float(np.dot(weights, factors) / weights.sum())
+
 
     def get_estimate(self) -> dict:
         """Returns a dictionary of the CO2e and the method used to calculate it."""
@@ -0,0 +1,151 @@
+from .. import app, db
+from sqlalchemy import Column, ForeignKey, String, Integer, DateTime, or_
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from datetime import datetime, timedelta
+from uuid import uuid4
+from .transaction import Transaction
+from .estimate import Estimate, EstimateError
+import threading, logging
+
+
+class EstimateJob(db.Model):
+    """Estimate job model for queueing transactions to be estimated outside of the request that needs them."""
+    __tablename__ = 'estimate_job'
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    transaction_id = Column(String(36), ForeignKey("transaction.id"), nullable=False, unique=True)
+    status = Column(String, nullable=False, default='pending')
+    attempts = Column(Integer, nullable=False, default=0)
+    error = Column(String, nullable=True)
+    created = Column(DateTime, nullable=False, default=datetime.utcnow)
+    updated = Column(DateTime, nullable=False, default=datetime.utcnow)
+
+    # Jobs left running for longer than this are assumed to belong to a worker that stopped, and are retried.
+    stale_after = timedelta(minutes=10)
+    max_attempts = 3
+
+    _wake = threading.Event()
+    _workers_started = False
+    _workers_lock = threading.Lock()
+
+
+    @staticmethod
+    def enqueue(*transaction_ids: str) -> None:
+        """Queues transactions for estimation, re-queueing any that have already been estimated. Commits the session."""
+
+        if len(transaction_ids) == 0: return
+
+        existing = {job.transaction_id: job for job in EstimateJob.query.filter(EstimateJob.transaction_id.in_(transaction_ids))}
+        for transaction_id in dict.fromkeys(transaction_ids):
+            job = existing.get(transaction_id)
+            if job is None:
+                db.session.add(EstimateJob(transaction_id=transaction_id))
+            elif job.status != 'pending':
+                job.status = 'pending'
+                job.attempts = 0
+                job.error = None
+                job.updated = datetime.utcnow()
+
+        db.session.commit()
+        EstimateJob._wake.set()
+
+    @staticmethod
+    def claim():
+        """Marks the oldest waiting job as running and returns it, or None if there are none. Safe across threads and processes."""
+
+        now = datetime.utcnow()
+        waiting = or_(EstimateJob.status == 'pending', (EstimateJob.status == 'running') & (EstimateJob.updated < now - EstimateJob.stale_after))
+
+        for job in EstimateJob.query.filter(waiting).order_by(EstimateJob.created).limit(10):
+            claimed = EstimateJob.query.filter(EstimateJob.id == job.id, EstimateJob.updated == job.updated, waiting) \
+                .update({'status': 'running', 'attempts': job.attempts + 1, 'updated': now}, synchronize_session=False)
+            db.session.commit()
+            if claimed: return db.session.get(EstimateJob, job.id)
+
+    def run(self) -> None:
+        """Generates the estimate for this job's transaction and records the outcome, unless the job was re-queued or
+        reclaimed while it ran, in which case it is left for its next run."""
+
+        claimed = self.updated
+        try:
+            result = Estimate(db.session.get(Transaction, self.transaction_id)).generate_estimate()
+            if isinstance(result, dict):
+                status, error = 'done', None
+            else:
+                status, error = 'failed', result
+
+        # Retry only unexpected errors, not transactions that can't be estimated.
+        except EstimateError as e:
+            db.session.rollback()
+            status, error = 'failed', str(e)
+        except Exception as e:
+            db.session.rollback()
+            logging.exception(f'Estimate job for transaction {self.transaction_id} failed')
+            status = 'pending' if self.attempts < EstimateJob.max_attempts else 'failed'
+            error = str(e)
+
+        EstimateJob.query.filter(EstimateJob.id == self.id, EstimateJob.status == 'running', EstimateJob.updated == claimed) \
+            .update({'status': status, 'error': error, 'updated': datetime.utcnow()}, synchronize_session=False)
+        db.session.commit()
+
+
+    @staticmethod
+    def work(poll_interval: float = 5) -> None:
+        """Runs jobs until the process exits, waiting up to poll_interval seconds for new jobs when the queue is empty."""
+
+        while True:
+            try:
+                with app.app_context():
+                    job = EstimateJob.claim()
+                    if job: job.run()
+            except Exception:
+                logging.exception('Estimate worker could not run a job')
+                job = None
+
+            if job is None:
+                EstimateJob._wake.wait(poll_interval)
+                EstimateJob._wake.clear()
+
+    @staticmethod
+    def start_workers(count: int) -> None:
+        """Starts count background worker threads in this process, unless they have already been started."""
+
+        with EstimateJob._workers_lock:
+            if EstimateJob._workers_started: return
+            EstimateJob._workers_started = True
+
+        for n in range(count):
+            threading.Thread(target=EstimateJob.work, name=f'estimate-worker-{n}', daemon=True).start()
+
+
+class Lease(db.Model):
+    """Named lease held by one process at a time, for work that must only run in one place, such as the feed scheduler."""
+    __tablename__ = 'lease'
+
+    name = Column(String, primary_key=True)
+    holder = Column(String(36), nullable=False)
+    expires = Column(DateTime, nullable=False)
+
+
+    @staticmethod
+    def acquire(name: str, holder: str, duration: timedelta) -> bool:
+        """Takes or renews a lease for holder until duration from now, unless another holder's lease has not expired. Returns
+        True if holder has the lease. Commits the session."""
+
+        now = datetime.utcnow()
+        upsert = sqlite_insert(Lease).values(name=name, holder=holder, expires=now + duration)
+        db.session.execute(upsert.on_conflict_do_update(
+            index_elements=['name'],
+            set_={'holder': upsert.excluded.holder, 'expires': upsert.excluded.expires},
+            where=(Lease.holder == holder) | (Lease.expires < now)
+        ))
+        db.session.commit()
+
+        return Lease.query.filter_by(name=name, holder=holder).first() is not None
+
+    @staticmethod
+    def release(name: str, holder: str) -> None:
+        """Gives up a lease if holder has it. Commits the session."""
+
+        Lease.query.filter_by(name=name, holder=holder).delete()
+        db.session.commit()
@@ -1,11 +1,17 @@
 from .. import db
-from sqlalchemy import Column, ForeignKey, String, Integer, DateTime, PickleType
+from sqlalchemy import Column, ForeignKey, String, Integer, Float, DateTime, PickleType, Index, func, case
+from sqlalchemy.orm import column_property
 from uuid import uuid4
+from datetime import datetime, timedelta
 
 
 class Transaction(db.Model):
     """Transaction model for storing transaction data."""
     __tablename__ = 'transaction'
+    __table_args__ = (
+        Index('ix_transaction_user_id_datetime', 'user_id', 'datetime'),
+        Index('ix_transaction_merchant_id', 'merchant_id'),
+    )
     
     id = Column(String(36), primary_key=True, nullable=False)
     amount_pence = Column(Integer, nullable=False)
@@ -18,17 +24,62 @@ class Transaction(db.Model):
     user_id = Column(String(36), ForeignKey("user.id"))
     feed_log_id = Column(String(36), ForeignKey("feed_log.id"))
 
-    co2e = Column(Integer, nullable=True)
+    # Active history keeps the previous CO2e available when it changes, for maintaining merchant totals.
+    co2e = column_property(Column(Integer, nullable=True), active_history=True)
     estimate = db.relationship('Estimate', backref='estimate', lazy='select')
 
 
+    @staticmethod
+    def get_dashboard_totals(user_id: str, now: datetime = None) -> dict:
+        """Returns a user's CO2e for all time, the last 28 days, the last 7 days and the 7 days before, summed in one query."""
+
+        now = now or datetime.utcnow()
+        windows = {
+            'all_time': Transaction.datetime.isnot(None),
+            'last_four_weeks': Transaction.datetime > now - timedelta(days=28),
+            'this_week': Transaction.datetime >= now - timedelta(days=7),
+            'week_prior': (Transaction.datetime < now - timedelta(days=7)) & (Transaction.datetime >= now - timedelta(days=14)),
+        }
+
+        row = db.session.query(*(func.coalesce(func.sum(case((window, Transaction.co2e), else_=0)), 0) for window in windows.values())) \
+            .filter(Transaction.user_id == user_id, Transaction.co2e.isnot(None)).one()
+
+        return dict(zip(windows, row))
+
+
 class Receipt(db.Model):
     """Receipt model for storing receipt data."""
     __tablename__ = 'receipt'
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     transaction_id = Column(String(36), ForeignKey("transaction.id"), nullable=False, unique=True)
-    items = Column(PickleType, nullable=False)
+    items = db.relationship('ReceiptItem', backref='receipt', lazy='select', order_by='ReceiptItem.position', cascade='all, delete-orphan')
+
+    # Items of receipts saved before receipt_item, as a dict of name: "[weight, price]". Converted to ReceiptItems by migrate.
+    pickled_items = Column('items', PickleType, nullable=True)
+
+
+class ReceiptItem(db.Model):
+    """Receipt item model for storing each item of a receipt, and what it was estimated as."""
+    __tablename__ = 'receipt_item'
+    __table_args__ = (
+        Index('ix_receipt_item_receipt_id', 'receipt_id'),
+        Index('ix_receipt_item_name', 'name'),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    receipt_id = Column(String(36), ForeignKey("receipt.id"), nullable=False)
+    position = Column(Integer, nullable=False, default=0)
+
+    name = Column(String, nullable=False)
+    weight_kg = Column(Float, nullable=True)
+    price_pence = Column(Integer, nullable=False)
+
+    # Set when the receipt is estimated. Items with a weight record their closest category and its similarity, even if it
+    # was not close enough to use and the item was estimated by its price instead.
+    matched_category = Column(String, nullable=True)
+    similarity = Column(Float, nullable=True)
+    co2e = Column(Float, nullable=True)
     
 
 class Merchant(db.Model):
@@ -52,3 +103,7 @@ class FeedLog(db.Model):
     transactions = db.relationship('Transaction', backref='feed_log', lazy='dynamic', cascade='all, delete')
     user_id = Column(String(36), ForeignKey("user.id"))
     item_count = Column(Integer, nullable=False)
+
+    # Set on the logs of backfill windows. window_end is only set once every item in the window has been added.
+    window_start = Column(DateTime, nullable=True)
+    window_end = Column(DateTime, nullable=True)
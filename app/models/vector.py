@@ -0,0 +1,57 @@
+from sqlalchemy.types import TypeDecorator, LargeBinary
+import numpy as np
+import struct
+
+
+class Vector(TypeDecorator):
+    """Column type storing a vector as a raw little-endian float32 or float16 blob, after an 8 byte header of its dtype and dimension.
+
+    Any sequence of numbers can be written. Vectors are read as read-only numpy arrays over the blob, without copying.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    dtypes = {'float32': '<f4', 'float16': '<f2'}
+    header = struct.Struct('<3sxI')
+
+    def __init__(self, dtype: str = 'float32') -> None:
+        """Initialises the type to write vectors as float32 or float16."""
+
+        if dtype not in Vector.dtypes: raise ValueError('dtype must be float32 or float16')
+
+        super().__init__()
+        self.dtype = dtype
+
+    def process_bind_param(self, value, dialect) -> bytes:
+        if value is None: return None
+        return Vector.encode(value, self.dtype)
+
+    def process_result_value(self, value, dialect) -> np.ndarray:
+        if value is None: return None
+        return Vector.decode(value)
+
+
+    @staticmethod
+    def encode(value, dtype: str = 'float32') -> bytes:
+        """Returns the blob of a vector."""
+
+        array = np.asarray(value, dtype=Vector.dtypes[dtype])
+        if array.ndim != 1: raise ValueError('vector must be one dimensional')
+
+        return Vector.header.pack(array.dtype.str.encode(), len(array)) + array.tobytes()
+
+    @staticmethod
+    def decode(blob: bytes) -> np.ndarray:
+        """Returns the vector of a blob."""
+
+        dtype, dimension = Vector.header.unpack_from(blob)
+        return np.frombuffer(blob, dtype=np.dtype(dtype.decode()), count=dimension, offset=Vector.header.size)
+
+    @staticmethod
+    def dtype_of(blob: bytes) -> str or None:
+        """Returns the dtype name of a blob, or None if it is not a Vector blob."""
+
+        if len(blob) < Vector.header.size: return None
+        code = Vector.header.unpack_from(blob)[0].decode('latin-1')
+        return next((name for name, dtype in Vector.dtypes.items() if dtype == code), None)
@@ -1,5 +1,5 @@
-import requests
 import os
+from .client import http_client
 from json import loads
 
 
@@ -15,7 +15,7 @@ class Asprise:
 
         asprise_api_uri = 'https://ocr.asprise.com/api/v1/receipt'
 
-        r = requests.post(asprise_api_uri, data = { \
+        r = http_client.post(asprise_api_uri, data = { \
             'api_key': os.getenv('ASPRISE_API_KEY', 'TEST'),
             'recognizer': 'GB',
             'ref_no': ref,
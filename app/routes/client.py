@@ -0,0 +1,84 @@
+import os, time, threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib.parse import urlparse
+from collections import defaultdict
+
+
+class HTTPClient:
+    """A shared HTTP client that keeps connections alive in a pool, applies timeouts, retries with backoff on 429 and 5xx responses, and records per-host metrics."""
+
+    retry_statuses = (429, 500, 502, 503, 504)
+
+    def __init__(self, pool_size: int = 10, timeout: float = 30, retries: int = 3, backoff: float = 0.5) -> None:
+        """Initialises the client's session and connection pools."""
+
+        if pool_size < 1: raise ValueError('pool_size must be at least 1')
+
+        self.timeout = timeout
+        self.session = requests.Session()
+
+        # Only idempotent methods are retried, and Retry-After headers are respected.
+        retry = Retry(total=retries, backoff_factor=backoff, status_forcelist=self.retry_statuses, respect_retry_after_header=True, raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        self._adapter = adapter
+        self._metrics = defaultdict(lambda: {'requests': 0, 'errors': 0, 'seconds': 0.0})
+        self._lock = threading.Lock()
+
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Makes a request through the pool, with the default timeout unless one is given."""
+
+        kwargs.setdefault('timeout', self.timeout)
+        host = urlparse(url).netloc
+        start = time.perf_counter()
+        error = True
+
+        try:
+            r = self.session.request(method, url, **kwargs)
+            error = r.status_code >= 400
+            return r
+        finally:
+            with self._lock:
+                metrics = self._metrics[host]
+                metrics['requests'] += 1
+                metrics['errors'] += error
+                metrics['seconds'] += time.perf_counter() - start
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        return self.request('PUT', url, **kwargs)
+
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """Shares this client's connection pools and retries with another session, such as an OAuth session."""
+
+        session.mount('https://', self._adapter)
+        session.mount('http://', self._adapter)
+        return session
+
+    def get_metrics(self) -> dict:
+        """Returns a dictionary of host: {requests, errors, seconds, average_seconds}."""
+
+        with self._lock:
+            return {
+                host: {**metrics, 'average_seconds': metrics['seconds'] / metrics['requests']}
+                for host, metrics in self._metrics.items()
+            }
+
+
+# Shared by every Starling and Asprise request in this process.
+http_client = HTTPClient(
+    pool_size=int(os.getenv('HTTP_POOL_SIZE', 10)),
+    timeout=float(os.getenv('HTTP_TIMEOUT', 30)),
+    retries=int(os.getenv('HTTP_RETRIES', 3))
+)
@@ -5,19 +5,31 @@ from authlib.integrations.requests_client import OAuth2Session
 from flask import make_response, redirect, request
 from ..models.user import load_user
 from ..models.transaction import FeedLog, Transaction, Merchant
-import os, requests, json
+from ..models.job import EstimateJob
+from .client import http_client
+import os, json, time
 from datetime import datetime, timedelta
 from uuid import uuid4
-from sqlalchemy import text
+from concurrent.futures import ThreadPoolExecutor
+from sqlalchemy import text, func
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 
 
 # Variables for requests to Starling's API.
 client_id = os.environ.get('CLIENT_ID')
 client_secret = os.environ.get('CLIENT_SECRET')
 auth_uri = 'https://oauth-sandbox.starlingbank.com'
-api_uri = 'https://api-sandbox.starlingbank.com'
+api_uri = os.getenv('STARLING_API_URI', 'https://api-sandbox.starlingbank.com')
 user_agent = 'GroceryEmissionTracker|SmithJJ7@cardiff.ac.uk|FlaskApp|1.0'
 acceptable_categories = ['GROCERIES', 'EATING_OUT', 'GENERAL']
+mcc_lookup_workers = int(os.getenv('MCC_LOOKUP_WORKERS', 8))
+
+# Seconds between checks that an access token still works. Tokens are never assumed valid past their expiry.
+token_check_interval = int(os.getenv('STARLING_TOKEN_CHECK_SECONDS', 900))
+
+# Backfills request this many days of history at a time, and commit every chunk of this many new transactions.
+feed_backfill_window_days = int(os.getenv('FEED_BACKFILL_WINDOW_DAYS', 30))
+feed_backfill_chunk_size = int(os.getenv('FEED_BACKFILL_CHUNK_SIZE', 500))
 
 
 
@@ -28,16 +40,20 @@ def check_authorized():
     if request.endpoint in app.view_functions and not hasattr(app.view_functions[request.endpoint], 'exclude_from_auth_check') and current_user.is_authenticated:
 
         if 'access_token' not in session: return redirect(url_for('get_access_token'))
-        else:
-            # Get name is used to check for an expired access token.
+
+        # Get name is used to check for an expired access token, but only once per check interval. Tokens rejected in
+        # between are handled by the StarlingUnauthorized error handler.
+        if 'name' not in session or session.get('token_checked_until', 0) <= time.time():
             name = Starling.get_name()
             if name is None: return redirect(url_for('get_access_token'))
-            else: session['name'] = name
+            session['name'] = name
 
-            # If there is an access token the following required data should be available, but check.
+            expires_at = session.get('access_token_expires_at') or float('inf')
+            session['token_checked_until'] = min(time.time() + token_check_interval, expires_at)
+
+        # If there is an access token the following required data should be available, but check.
         if 'account_uid' not in session or 'default_category' not in session:
-            r = Starling.get_account_info()
-            if 'error' in r and r['error'] == 'invalid_token': return redirect(url_for('get_access_token'))
+            Starling.get_account_info()
 
 
 def exclude_from_auth_check(func):
@@ -45,6 +61,78 @@ def exclude_from_auth_check(func):
 
     func.exclude_from_auth_check = True
     return func
+
+
+def save_access_token(token: dict) -> None:
+    """Stores a new access token and its expiry in the session, so that it is checked on the next request."""
+
+    session['access_token'] = token['access_token']
+    session['access_token_expires_at'] = token.get('expires_at')
+    session.pop('token_checked_until', None)
+
+
+def existing_ids(column, ids, chunk_size: int = 500) -> set:
+    """Returns the ids that are already in a primary key column, querying in chunks to stay within SQLite's variable limit."""
+
+    ids = list(ids)
+    existing = set()
+    for start in range(0, len(ids), chunk_size):
+        existing.update(id for id, in db.session.query(column).filter(column.in_(ids[start:start + chunk_size])))
+
+    return existing
+
+
+def iter_feed_items(r, chunk_size: int = 65536):
+    """Yields the items of a streamed feed response's feedItems array as they arrive, without reading the whole response into memory."""
+
+    decoder = json.JSONDecoder()
+    r.encoding = r.encoding or 'utf-8'
+    chunks = r.iter_content(chunk_size, decode_unicode=True)
+    buffer = ''
+
+    # Skip to the start of the array.
+    for chunk in chunks:
+        buffer += chunk
+        start = buffer.find('"feedItems"')
+        if start != -1 and buffer.find('[', start) != -1:
+            buffer = buffer[buffer.find('[', start) + 1:]
+            break
+    else: return
+
+    # Decode each item once all of it has arrived.
+    while True:
+        buffer = buffer.lstrip(' \t\r\n,')
+        if buffer.startswith(']'): return
+
+        try:
+            item, end = decoder.raw_decode(buffer)
+        except ValueError:
+            chunk = next(chunks, None)
+            if chunk is None: raise ValueError('Feed response ended before the end of feedItems')
+            buffer += chunk
+            continue
+
+        yield item
+        buffer = buffer[end:]
+
+
+class StarlingUnauthorized(Exception):
+    """Raised when Starling rejects the access token used for a request."""
+
+
+@app.errorhandler(StarlingUnauthorized)
+def reauthorize(error):
+    """Sends the user to re-authorise with Starling when an API call is rejected. htmx requests redirect the whole page."""
+
+    db.session.rollback()
+    session.pop('token_checked_until', None)
+
+    if 'HX-Request' in request.headers:
+        resp = make_response('', 200)
+        resp.headers['HX-Redirect'] = url_for('get_access_token')
+        return resp
+
+    return redirect(url_for('get_access_token'))
     
 
 
@@ -52,6 +140,16 @@ def exclude_from_auth_check(func):
 class Starling:
     """A class for interacting with Starling's API."""
 
+    @staticmethod
+    def get(url: str, access_token: str, **kwargs):
+        """Makes an authorised GET request to Starling's API. Raises StarlingUnauthorized if the access token is rejected."""
+
+        headers = {'Authorization': f'Bearer {access_token}', 'user_agent': user_agent}
+        r = http_client.get(url, headers=headers, **kwargs)
+        if r.status_code == 401: raise StarlingUnauthorized(url)
+
+        return r
+
     @staticmethod
     def get_name() -> str or None:
         """Requests an account holder's name from Starling's API. Returns the name if available, else None."""
@@ -59,23 +157,23 @@ class Starling:
         access_token = session['access_token']
         headers = {'Authorization': f'Bearer {access_token}', 'user_agent': user_agent}
         url = api_uri + '/api/v2/account-holder/name'
-        r = requests.get(url, headers=headers)
+        r = http_client.get(url, headers=headers)
         dict = json.loads(r.text)
 
         if 'accountHolderName' in dict: return dict['accountHolderName']
     
     @staticmethod
-    def get_account_info():
-        """Requests account information from Starling's API. Returns a dictionary of info if available, else None."""
+    def get_account_info(access_token: str = None):
+        """Requests account information from Starling's API. Returns a dictionary of info if available, else None.
+        Without an access token, the session's is used and the account details are saved to the session."""
 
-        access_token = session['access_token']
         url = api_uri + '/api/v2/accounts'
-        headers = {'Authorization': f'Bearer {access_token}', 'user_agent': user_agent}
-        r = requests.get(url, headers=headers)
+        r = Starling.get(url, access_token or session['access_token'])
         dict = json.loads(r.text)
 
-        session['account_uid'] = dict['accounts'][0]['accountUid']
-        session['default_category'] = dict['accounts'][0]['defaultCategory']
+        if access_token is None:
+            session['account_uid'] = dict['accounts'][0]['accountUid']
+            session['default_category'] = dict['accounts'][0]['defaultCategory']
 
         return dict
 
@@ -86,86 +184,171 @@ class Starling:
         access_token = session['access_token']
         headers = {'Authorization': f'Bearer {access_token}', 'user_agent': user_agent}
         url = api_uri + '/api/v2/identity/logout'
-        requests.put(url, headers=headers)
+        http_client.put(url, headers=headers)
     
     @staticmethod
-    def get_feed() -> dict or None:
-        """Requests the user's feed from Starling's API. Returns a dictionary of feed items if available, else None."""
-
-        # Load user, get last pull datetime, and get account info.
-        user = load_user(current_user.id)
-        feed_logs = user.feed_logs
-        
-        if feed_logs.all(): last_pull = feed_logs.order_by(text('datetime desc')).limit(1).first().datetime
+    def get_feed() -> int or None:
+        """Requests the current user's feed from Starling's API with the session's access token, and adds new transactions to the DB."""
+
+        return Starling.sync_feed(load_user(current_user.id), session['account_uid'], session['default_category'], session['access_token'])
+
+    @staticmethod
+    def sync_feed(user, account_uid: str, default_category: str, access_token: str) -> int or None:
+        """Requests a user's feed from Starling's API and adds new transactions to the DB. Returns the number added, or None if
+        the feed was unavailable."""
+
+        # Get last pull datetime, ignoring backfills.
+        last_feed_log = user.feed_logs.filter(FeedLog.window_start == None).order_by(text('datetime desc')).first()
+
+        if last_feed_log: last_pull = last_feed_log.datetime
         else: last_pull = datetime.utcnow() - timedelta(days=56)
 
         last_pull = last_pull.isoformat(timespec='milliseconds') + 'Z'
 
-        account_uid = session['account_uid']
-        default_category = session['default_category']
-        access_token = session['access_token']
-
         # Get the transactions.
         url = f'{api_uri}/api/v2/feed/account/{account_uid}/category/{default_category}?changesSince={last_pull}'
-        headers = {'Authorization': f'Bearer {access_token}', 'user_agent': user_agent}
-        r = requests.get(url, headers=headers)
+        r = Starling.get(url, access_token)
         current_datetime = datetime.utcnow()
         dict = json.loads(r.text)
 
-        # Check if there are acceptable feed items, if so count them, add to DB, and log.
-        feed_id = str(uuid4())
-        count = 0
-
         if 'feedItems' not in dict: return None
-        for item in dict['feedItems']:
-            item_id = item['feedItemUid']
-            if item['spendingCategory'] in acceptable_categories and item['counterPartyType'] == 'MERCHANT' and Transaction.query.get(item_id) == None and item['direction'] == 'OUT' and item['status'] == 'SETTLED':
-
-                # Add the merchant to the DB if it doesn't already exist.
-                if Merchant.query.get(item['counterPartyUid']) == None:
-                    merchant = Merchant(
-                        id=item['counterPartyUid'],
-                        name=item['counterPartyName'],
-                        mcc=Starling.get_mcc(item_id)
-                    )
-                    db.session.add(merchant)
-                    db.session.commit()
-
-                # Add the transaction to the DB.
-                item['feedItemUid'] = Transaction(
-                    id=item['feedItemUid'],
-                    amount_pence=item['amount']['minorUnits'],
-                    datetime=datetime.fromisoformat(item['transactionTime'][:-1]),
-                    user_id=user.id,
-                    feed_log_id=feed_id,
-                    merchant_id=item['counterPartyUid']
-                )
-                db.session.add(item['feedItemUid'])
-                count += 1
-            
-        # Commit the changes to the DB and log the feed pull.
-        if count > 0:
-            new_feed_log = FeedLog(
-                id=feed_id,
-                user_id=user.id,
-                datetime=current_datetime,
-                item_count=count
+        return Starling.add_feed_items(user, dict['feedItems'], current_datetime, account_uid, default_category, access_token)
+
+    @staticmethod
+    def add_feed_items(user, feed_items: list, pulled: datetime, account_uid: str, default_category: str, access_token: str, feed_log: FeedLog = None) -> int:
+        """Adds the acceptable feed items that aren't already in the DB as transactions, with any new merchants, and logs the pull
+        in a new feed log, or adds to the count of the one given. Returns the number of transactions added."""
+
+        # Keep acceptable feed items, once each.
+        items = {
+            item['feedItemUid']: item for item in feed_items
+            if item['spendingCategory'] in acceptable_categories and item['counterPartyType'] == 'MERCHANT' and item['direction'] == 'OUT' and item['status'] == 'SETTLED'
+        }
+
+        # Find the transactions and merchants that are already in the DB with one query each.
+        existing_transactions = existing_ids(Transaction.id, items.keys())
+        items = {item_id: item for item_id, item in items.items() if item_id not in existing_transactions}
+        if len(items) == 0: return 0
+
+        existing_merchants = existing_ids(Merchant.id, {item['counterPartyUid'] for item in items.values()})
+
+        # Note merchants that aren't in the DB, with a feed item to look up their MCC from.
+        new_merchants = {}
+        for item_id, item in items.items():
+            if item['counterPartyUid'] not in existing_merchants and item['counterPartyUid'] not in new_merchants:
+                new_merchants[item['counterPartyUid']] = (item['counterPartyName'], item_id)
+
+        # Look up the new merchants' MCCs concurrently.
+        with ThreadPoolExecutor(max_workers=mcc_lookup_workers) as executor:
+            mccs = list(executor.map(
+                lambda feed_item_uid: Starling.get_mcc(feed_item_uid, account_uid, default_category, access_token),
+                [item_id for name, item_id in new_merchants.values()]
+            ))
+
+        # Log the feed pull, and insert the merchants and transactions in bulk. Rows added since the checks above are skipped.
+        if feed_log is None:
+            feed_log = FeedLog(id=str(uuid4()), user_id=user.id, datetime=pulled, item_count=0)
+            db.session.add(feed_log)
+        feed_id = feed_log.id
+
+        if len(new_merchants) > 0:
+            db.session.execute(
+                sqlite_insert(Merchant).on_conflict_do_nothing(index_elements=['id']),
+                [{'id': merchant_id, 'name': name, 'mcc': mcc} for (merchant_id, (name, item_id)), mcc in zip(new_merchants.items(), mccs)]
             )
-            db.session.add(new_feed_log)
+
+        added = db.session.execute(
+            sqlite_insert(Transaction).on_conflict_do_nothing(index_elements=['id']).returning(Transaction.id),
+            [
+                {
+                    'id': item_id,
+                    'amount_pence': item['amount']['minorUnits'],
+                    'datetime': datetime.fromisoformat(item['transactionTime'][:-1]),
+                    'user_id': user.id,
+                    'feed_log_id': feed_id,
+                    'merchant_id': item['counterPartyUid']
+                }
+                for item_id, item in items.items()
+            ]
+        ).scalars().all()
+        feed_log.item_count += len(added)
+        db.session.commit()
+
+        # Estimate the new transactions in the background.
+        EstimateJob.enqueue(*added)
+
+        return len(added)
+
+    @staticmethod
+    def backfill_feed(user, account_uid: str, default_category: str, access_token: str, since: datetime, until: datetime = None, progress: callable = None) -> int:
+        """Adds a user's transactions between two times, requesting the feed in windows of FEED_BACKFILL_WINDOW_DAYS and committing
+        every FEED_BACKFILL_CHUNK_SIZE transactions. Completed windows are logged, so an interrupted backfill resumes after the
+        last of them. Calls progress, if given, with the start, end and transactions added of each completed window. Returns the
+        number of transactions added."""
+
+        until = until or datetime.utcnow()
+        window = timedelta(days=feed_backfill_window_days)
+
+        # Resume after the latest completed window in range.
+        checkpoint = db.session.query(func.max(FeedLog.window_end)) \
+            .filter(FeedLog.user_id == user.id, FeedLog.window_start != None, FeedLog.window_end > since, FeedLog.window_start < until).scalar()
+        start = max(since, checkpoint) if checkpoint else since
+
+        count = 0
+        while start < until:
+            end = min(start + window, until)
+            feed_log = FeedLog(id=str(uuid4()), user_id=user.id, datetime=datetime.utcnow(), item_count=0, window_start=start)
+            db.session.add(feed_log)
+
+            url = f'{api_uri}/api/v2/feed/account/{account_uid}/category/{default_category}/transactions-between' \
+                f'?minTransactionTimestamp={start.isoformat(timespec="milliseconds")}Z&maxTransactionTimestamp={end.isoformat(timespec="milliseconds")}Z'
+
+            with Starling.get(url, access_token, stream=True) as r:
+                r.raise_for_status()
+                chunk = []
+                for item in iter_feed_items(r):
+                    chunk.append(item)
+                    if len(chunk) == feed_backfill_chunk_size:
+                        count += Starling.add_feed_items(user, chunk, feed_log.datetime, account_uid, default_category, access_token, feed_log)
+                        chunk = []
+
+                count += Starling.add_feed_items(user, chunk, feed_log.datetime, account_uid, default_category, access_token, feed_log)
+
+            # Mark the window complete.
+            feed_log.window_end = end
             db.session.commit()
+            if progress: progress(start, end, feed_log.item_count)
+
+            start = end
+
+        return count
 
     @staticmethod
-    def get_mcc(feed_item_uid: uuid4) -> dict or None:
-        """Requests the merchant data for a given feed item from Starling's API. Returns a dictionary of data if available, else None."""
+    def refresh_access_token(user) -> dict:
+        """Exchanges a user's refresh token for a new access token, and saves the replacement refresh token to the DB. Returns the token."""
 
-        account_uid = session["account_uid"]
-        default_category = session["default_category"]
-        access_token = session['access_token']
+        client = http_client.mount(OAuth2Session(client_id, client_secret))
+        token = client.refresh_token(f'{api_uri}/oauth/access-token', refresh_token=user.refresh_token, client_id=client_id, client_secret=client_secret)
+
+        # Update refresh token in the database.
+        user.refresh_token = (f'{token["refresh_token"]}')
+        user.refresh_token_date = datetime.now()
+        db.session.commit()
+
+        return token
+
+    @staticmethod
+    def get_mcc(feed_item_uid: uuid4, account_uid: str = None, default_category: str = None, access_token: str = None) -> dict or None:
+        """Requests the merchant data for a given feed item from Starling's API. Returns a dictionary of data if available, else None.
+        Account details default to those in the session; pass them explicitly to call this outside of a request."""
+
+        account_uid = account_uid or session["account_uid"]
+        default_category = default_category or session["default_category"]
+        access_token = access_token or session['access_token']
 
         # Get the merchant data.
         uri = f'{api_uri}/api/v2/feed/account/{account_uid}/category/{default_category}/{feed_item_uid}/mastercard'
-        headers = {'Authorization': f'Bearer {access_token}', 'user_agent': user_agent}
-        r = requests.get(uri, headers=headers)
+        r = Starling.get(uri, access_token)
         if 'mcc' in r.text:
             return json.loads(r.text)['mcc']
 
@@ -177,25 +360,19 @@ class Starling:
 def get_access_token():
     """Requests an access token from Starling's API."""
 
-    # Set up an OAuth session.
-    client = OAuth2Session(client_id, client_secret)
     user = load_user(current_user.id)
 
     # First try fetching a refresh token from the database and using it to get a new access token.
     try:
 
-        token = client.refresh_token(f'{api_uri}/oauth/access-token', refresh_token=user.refresh_token, client_id=client_id, client_secret=client_secret)
-        session['access_token'] = token['access_token']
-
-        # Update refresh token in the database.
-        user.refresh_token = (f'{token["refresh_token"]}')
-        user.refresh_token_date = datetime.now()
-        db.session.commit()
+        token = Starling.refresh_access_token(user)
+        save_access_token(token)
 
         return redirect(url_for('home'))
     
     except:
 
+        client = http_client.mount(OAuth2Session(client_id, client_secret))
         uri, state = client.create_authorization_url(auth_uri)
 
         # Response and cookies.
@@ -221,7 +398,7 @@ def authorize():
     # Session must be reinstated after being redirected to Starling
     cookies = request.cookies
     state = cookies.get('state')
-    client = OAuth2Session(client_id, client_secret, state=state)
+    client = http_client.mount(OAuth2Session(client_id, client_secret, state=state))
 
     # Get the access token. The fetch token method will automatically check the state in case of CSRF attack
     authorization_response = request.url
@@ -233,7 +410,7 @@ def authorize():
         'state',
         expires=0
         )
-    session['access_token'] = token['access_token']
+    save_access_token(token)
 
     # Update the refresh token in the database.
     user = load_user(current_user.id)
@@ -244,7 +421,7 @@ def authorize():
     if user.starling_uid == None:
         headers = {'Authorization': f'Bearer {token["access_token"]}', 'user_agent': user_agent}
         url = f'{api_uri}/api/v2/account-holder'
-        r = requests.get(url, headers=headers)
+        r = http_client.get(url, headers=headers)
         data = r.json()
         starling_uid = data['accountHolderUid']
         user.starling_uid = starling_uid
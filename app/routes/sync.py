@@ -0,0 +1,150 @@
+from .. import app, db
+from ..models.user import User
+from ..models.job import Lease
+from .starling import Starling, StarlingUnauthorized
+from datetime import timedelta
+from uuid import uuid4
+import os, time, random, logging
+from ast import literal_eval
+
+
+# Set when a feed_sync.py process pulls every connected user's feed, so the dashboard no longer pulls it when it loads.
+feed_sync = literal_eval(os.getenv('FEED_SYNC', 'False'))
+
+# Seconds between feed pulls for each user, varied by up to the jitter fraction so that pulls are spread out.
+feed_sync_interval = int(os.getenv('FEED_SYNC_INTERVAL', 300))
+feed_sync_jitter = float(os.getenv('FEED_SYNC_JITTER', 0.2))
+
+
+
+class FeedSync:
+    """Background scheduler that keeps each connected user's transactions up to date with their Starling feed.
+
+    Only the scheduler holding the feed sync lease pulls feeds, so that two never refresh the same user's token at once. Any
+    other stands by, and takes over if the lease lapses.
+    """
+
+    # Access tokens are refreshed this many seconds before they expire.
+    token_margin = 60
+
+    # Seconds between checks for newly connected users.
+    poll_interval = 30
+
+    # Users whose pulls keep failing are retried at doubling intervals, up to this many seconds apart.
+    max_backoff = 86400
+
+    # The lease is renewed before each pull to last this long, so a stopped scheduler is taken over within it.
+    lease_name = 'feed-sync'
+    lease_duration = timedelta(minutes=10)
+
+    def __init__(self, interval: float = feed_sync_interval, jitter: float = feed_sync_jitter) -> None:
+        """Initialises the schedule. Users connected at startup are first pulled at random times within one interval, and users
+        who connect later as soon as they are seen."""
+
+        if interval <= 0: raise ValueError('interval must be positive')
+        if not 0 <= jitter < 1: raise ValueError('jitter must be between 0 and 1')
+
+        self.interval = interval
+        self.jitter = jitter
+
+        self._next_pull = {}    # user id: time.time() of the user's next pull
+        self._failures = {}     # user id: consecutive failed pulls
+        self._tokens = {}       # user id: (access token, expires at, account uid, default category)
+        self._started = False
+        self.holder = str(uuid4())
+
+    def delay(self, failures: int = 0) -> float:
+        """Returns the seconds until a user's next pull, doubling for each consecutive failure."""
+
+        return min(self.interval * 2 ** failures, self.max_backoff) * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+
+    def due(self, now: float) -> list:
+        """Returns the users with a refresh token whose next pull is due, scheduling any that are new."""
+
+        users = User.query.filter(User.refresh_token != None).all()
+        for user in users:
+            if user.id not in self._next_pull: self._next_pull[user.id] = now + (random.uniform(0, self.interval) if not self._started else 0)
+        self._started = True
+
+        # Forget users who have disconnected.
+        for user_id in set(self._next_pull) - {user.id for user in users}:
+            self._next_pull.pop(user_id)
+            self._failures.pop(user_id, None)
+            self._tokens.pop(user_id, None)
+
+        return [user for user in users if self._next_pull[user.id] <= now]
+
+    def credentials(self, user: User) -> tuple:
+        """Returns (account uid, default category, access token) for a user, refreshing the access token when it expires."""
+
+        access_token, expires_at, account_uid, default_category = self._tokens.get(user.id, (None, 0, None, None))
+
+        if expires_at - self.token_margin <= time.time():
+            refresh_token = user.refresh_token
+            try:
+                token = Starling.refresh_access_token(user)
+            except Exception:
+                # The user may have re-authorised through the web app meanwhile, rotating the refresh token.
+                db.session.rollback()
+                db.session.refresh(user)
+                if user.refresh_token == refresh_token: raise
+                token = Starling.refresh_access_token(user)
+
+            access_token = token['access_token']
+            expires_at = token.get('expires_at') or time.time() + self.interval
+            account = Starling.get_account_info(access_token)['accounts'][0]
+            account_uid, default_category = account['accountUid'], account['defaultCategory']
+            self._tokens[user.id] = (access_token, expires_at, account_uid, default_category)
+
+        return account_uid, default_category, access_token
+
+    def pull(self, user: User) -> int or None:
+        """Pulls one user's feed. Returns the number of new transactions."""
+
+        try:
+            return Starling.sync_feed(user, *self.credentials(user))
+        except StarlingUnauthorized:
+            self._tokens.pop(user.id, None)
+            raise
+
+
+    def run_once(self) -> float:
+        """Pulls the feeds that are due, if this scheduler holds the lease. Returns the seconds until the next pull is due."""
+
+        now = time.time()
+        for user in self.due(now):
+            if not Lease.acquire(FeedSync.lease_name, self.holder, FeedSync.lease_duration):
+                # Another scheduler is pulling feeds, and may refresh the tokens cached here.
+                self._tokens.clear()
+                return self.poll_interval
+
+            try:
+                count = self.pull(user)
+                self._failures[user.id] = 0
+                if count: logging.info(f'Feed sync added {count} transactions for user {user.id}')
+            except Exception:
+                db.session.rollback()
+                self._failures[user.id] = self._failures.get(user.id, 0) + 1
+                logging.exception(f'Feed sync failed for user {user.id}')
+
+            self._next_pull[user.id] = time.time() + self.delay(self._failures[user.id])
+
+        return min(self._next_pull.values(), default=now + self.interval) - time.time()
+
+    def run(self) -> None:
+        """Pulls feeds as they fall due until the process exits, then gives up the lease."""
+
+        try:
+            while True:
+                try:
+                    with app.app_context():
+                        wait = self.run_once()
+                except Exception:
+                    logging.exception('Feed sync could not run')
+                    wait = self.interval
+
+                time.sleep(min(max(wait, 1), self.poll_interval))
+        finally:
+            with app.app_context():
+                Lease.release(FeedSync.lease_name, self.holder)
@@ -1,17 +1,24 @@
 from .. import app, db
 from flask import render_template, redirect, jsonify, url_for, request, session
-from datetime import datetime, timedelta
+from datetime import datetime
 from flask_login import current_user, login_required
 from .starling import Starling, exclude_from_auth_check
 from ..models.user import load_user
-from ..models.transaction import Transaction, Receipt
-from ..models.estimate import Estimate
+from ..models.transaction import Transaction, Receipt, ReceiptItem
+from ..models.job import EstimateJob
+from ..models.aggregate import DailyTotal
 from ..forms.user import ReceiptForm
 from werkzeug.exceptions import HTTPException
 from .asprise import Asprise
+from .sync import feed_sync
 import ast, os
 
 
+# Source of the dashboard totals: per-user daily rollups (rollup), or a grouped query over transactions (sql).
+dashboard_totals = os.getenv('DASHBOARD_TOTALS', 'rollup')
+if dashboard_totals not in ('rollup', 'sql'): raise ValueError('DASHBOARD_TOTALS must be rollup or sql')
+
+
 def login_required(f):
     """A wrapper for the login_required decorator from Flask-Login."""
     
@@ -53,25 +60,14 @@ def dashboard():
     if current_user.is_authenticated == False: return redirect('/login')
     
     name = session['name']
-    transactions = load_user(current_user.id).transactions.all()
-    all_time = 0
-    last_four_weeks = 0
-    this_week = 0
-    week_prior = 0
-
-    for transaction in transactions:
-        if transaction.co2e is not None:
-
-            all_time += transaction.co2e
 
-            if transaction.datetime > datetime.utcnow() - timedelta(days=28):
-                last_four_weeks += transaction.co2e
-
-            if transaction.datetime >= datetime.utcnow() - timedelta(days=7):
-                this_week += transaction.co2e
-
-            if transaction.datetime < datetime.utcnow() - timedelta(days=7) and transaction.datetime >= datetime.utcnow() - timedelta(days=14):
-                week_prior += transaction.co2e
+    # Rollup totals count whole days. The sql source sums the user's transactions over exact windows instead.
+    if dashboard_totals == 'sql': totals = Transaction.get_dashboard_totals(current_user.id)
+    else: totals = DailyTotal.get_dashboard_totals(current_user.id)
+    all_time = totals['all_time']
+    last_four_weeks = totals['last_four_weeks']
+    this_week = totals['this_week']
+    week_prior = totals['week_prior']
     
     # four week change in percentage: avoid division by zero
     if week_prior == 0 and this_week == 0: week_on_week_change = 0
@@ -91,7 +87,8 @@ def dashboard():
 def transaction_feed():
     """Feeds transactions to the dashboard via htmx."""
 
-    Starling.get_feed()
+    # The feed is pulled by the background scheduler when it is enabled, so only local data is read here.
+    if not feed_sync: Starling.get_feed()
 
     user = load_user(current_user.id)
     transactions = db.paginate(user.transactions.order_by(db.desc('datetime')), per_page=6)
@@ -106,14 +103,20 @@ def get_co2e_estimate(transaction_id):
 
     transaction = Transaction.query.get(transaction_id)
     if transaction:
-        estimate = Estimate(transaction)
-        estimate.generate_estimate()
-
-        if 'dashboard' in request.referrer:
-            return f'<span class="mb-0 fs-5 float-end estimate">{round(estimate.get_estimate()["co2e"], 3)}kg</span>'
+        if not request.referrer or 'dashboard' not in request.referrer: return redirect(url_for('dashboard'))
+
+        # Estimates are generated by the job queue. Return the current estimate, or a placeholder that polls until it is ready.
+        job = EstimateJob.query.filter_by(transaction_id=transaction_id).first()
+        if job is None and transaction.co2e is None:
+            EstimateJob.enqueue(transaction_id)
+            job = EstimateJob.query.filter_by(transaction_id=transaction_id).first()
+
+        if job is None or job.status == 'done' or (job.status == 'failed' and transaction.co2e is not None):
+            return f'<span class="mb-0 fs-5 float-end estimate">{round(transaction.co2e, 3)}kg</span>'
+        elif job.status == 'failed':
+            return '<span class="mb-0 fs-5 float-end estimate">unavailable</span>'
         else:
-            return redirect(url_for('dashboard'))
-        # return jsonify({'co2e': estimate.co2e, 'method': estimate.method})
+            return f'<span class="mb-0 fs-5 float-end estimate pending" hx-get="{url_for("get_co2e_estimate", transaction_id=transaction_id)}" hx-trigger="load delay:2s" hx-swap="outerHTML">estimating...</span>'
 
     else: return 'not found', 404
 
@@ -126,17 +129,24 @@ def add_receipt(transaction_id):
     receipt_form = ReceiptForm()
 
     if receipt_form.validate_on_submit():
-        items_dict = {}
+        items = []
         for item in request.form.items():
             if item[0].startswith('i') and item[0][-1] != 'd':
-                items_dict[item[1]] = f"[{request.form['w' + item[0][1:]] or 'None'}, {int(float(request.form['p' + item[0][1:]]) * 100)}]"
+                weight = request.form['w' + item[0][1:]]
+                items.append(ReceiptItem(
+                    position=len(items),
+                    name=item[1],
+                    weight_kg=float(weight) if weight else None,
+                    price_pence=int(float(request.form['p' + item[0][1:]]) * 100)
+                ))
 
         receipt = Receipt(
             transaction_id=transaction_id,
-            items=items_dict
+            items=items
         )
         db.session.add(receipt)
         db.session.commit()
+        EstimateJob.enqueue(transaction_id)
         return redirect(url_for('get_co2e_estimate', transaction_id=transaction_id))
 
     transaction = Transaction.query.get(transaction_id)
@@ -0,0 +1,18 @@
+import sys
+from app import app, db
+from app.models.transaction import Transaction
+from app.models.estimate import Estimate
+
+# Re-estimates every transaction from scratch, oldest first, in chunks that are each written in one commit.
+# Use after changing the ESTIMATE_BY_* settings. Usage: python backfill.py [chunk size]
+if __name__ == '__main__':
+    chunk_size = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+
+    with app.app_context():
+        transaction_ids = [transaction_id for (transaction_id,) in db.session.query(Transaction.id).order_by(Transaction.datetime)]
+
+        for start in range(0, len(transaction_ids), chunk_size):
+            chunk = Transaction.query.filter(Transaction.id.in_(transaction_ids[start:start + chunk_size])).order_by(Transaction.datetime).all()
+            results = Estimate.generate_many(chunk, refresh=True)
+            estimated = sum(isinstance(result, dict) for result in results.values())
+            print(f'Estimated {estimated} of {len(chunk)} transactions ({start + len(chunk)}/{len(transaction_ids)}).')
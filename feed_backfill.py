@@ -0,0 +1,22 @@
+import sys
+from datetime import datetime, timedelta
+from app import app
+from app.models.user import User
+from app.routes.starling import Starling
+
+# Imports each connected user's transaction history from Starling, a window at a time. Interrupted backfills resume from
+# the last completed window. Usage: python feed_backfill.py [days of history]
+if __name__ == '__main__':
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 365
+    since = datetime.utcnow() - timedelta(days=days)
+
+    with app.app_context():
+        for user in User.query.filter(User.refresh_token != None).all():
+            print(f'Backfilling {days} days for user {user.id}...')
+            access_token = Starling.refresh_access_token(user)['access_token']
+            account = Starling.get_account_info(access_token)['accounts'][0]
+            count = Starling.backfill_feed(
+                user, account['accountUid'], account['defaultCategory'], access_token, since,
+                progress=lambda start, end, added: print(f'Backfilled {start.date()} to {end.date()}: {added} new transactions.')
+            )
+            print(f'Added {count} transactions for user {user.id}.')
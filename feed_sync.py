@@ -0,0 +1,9 @@
+import logging
+from app import app
+from app.routes.sync import FeedSync
+
+# Pulls every connected user's Starling feed as it falls due, in a separate process. Start the app with FEED_SYNC=True so the
+# dashboard doesn't pull feeds itself. Further feed_sync.py processes stand by, taking over if the running one stops.
+if __name__ == '__main__':
+    logging.basicConfig(level=logging.INFO)
+    FeedSync().run()
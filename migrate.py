@@ -0,0 +1,10 @@
+from app import app, db
+from app.migrate import migrate
+
+# Brings the database up to date with the models, failing on any change that can't be made rather than skipping it as
+# startup does. Usage: python migrate.py
+if __name__ == '__main__':
+    with app.app_context():
+        db.create_all()
+        migrate(strict=True)
+        print('Database is up to date.')
@@ -0,0 +1,6 @@
+from app import app
+from app.models.job import EstimateJob
+
+# Runs background estimation jobs in a separate process. Start the app with ESTIMATE_WORKERS=0 to use only this worker.
+if __name__ == '__main__':
+    EstimateJob.work()